@@ -12,7 +12,8 @@ from .modules import (
     ModuleStatus,
     ModuleIdentification,
     SFFModule,
-    CMISModule
+    CMISModule,
+    poll_all
 )
 from .capabilities import CapabilityManager, CapabilityRequirement
 
@@ -38,6 +39,7 @@ __all__ = [
     # Module implementations
     'SFFModule',
     'CMISModule',
+    'poll_all',
     
     # Capability management
     'CapabilityManager',
@@ -1,4 +1,4 @@
 from .hal import HardwareInterface, GPIOSignal
-from .hw_access import read_i2c, write_i2c, read_gpio, write_gpio
+from .hw_access import read_i2c, read_i2c_block, write_i2c, read_gpio, write_gpio
 
-__all__ = ['HardwareInterface', 'GPIOSignal', 'read_i2c', 'write_i2c', 'read_gpio', 'write_gpio']
\ No newline at end of file
+__all__ = ['HardwareInterface', 'GPIOSignal', 'read_i2c', 'read_i2c_block', 'write_i2c', 'read_gpio', 'write_gpio']
\ No newline at end of file
@@ -2,9 +2,13 @@
 Hardware Abstraction Layer for Pluggable Module Management.
 Provides a clean interface for I2C and GPIO operations.
 """
-from typing import Dict, Union
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
 from enum import Enum, auto
-from .hw_access import read_i2c, write_i2c, read_gpio, write_gpio
+from .hw_access import read_i2c, read_i2c_block, write_i2c, read_gpio, write_gpio
+
+_T = TypeVar('_T')
 
 class GPIOSignal(Enum):
     """Enumeration of available GPIO signals"""
@@ -21,7 +25,9 @@ class HardwareInterface:
     
     def __init__(self):
         # Add any initialization needed for hardware interface
-        pass
+        # Serializes transactions issued from worker threads on this bus; a
+        # thread lock is not tied to any one event loop
+        self._bus_lock = threading.Lock()
     
     def read_register(self, address: int) -> int:
         """
@@ -35,6 +41,60 @@ class HardwareInterface:
         """
         return read_i2c(address)  # Assuming read_i2c is globally available
     
+    def read_register_block(self, address: int, length: int,
+                            into: Optional[bytearray] = None) -> bytearray:
+        """
+        Read a block of consecutive registers in a single I2C transaction.
+        
+        Args:
+            address: The first memory address to read from
+            length: Number of bytes to read
+            into: Optional preallocated buffer (at least length bytes) to fill
+                in place, avoiding a new allocation per read
+            
+        Returns:
+            The buffer holding the values read (into, when provided)
+        """
+        buffer = into if into is not None else bytearray(length)
+        read_i2c_block(address, memoryview(buffer)[:length])
+        return buffer
+    
+    def run_exclusive(self, func: Callable[..., _T], *args: Any) -> _T:
+        """
+        Call func(*args) while holding this bus's lock.
+        
+        Used to serialize transactions that run in worker threads, so that
+        modules sharing this interface never access the bus concurrently.
+        
+        Args:
+            func: The callable performing the bus transaction
+            *args: Positional arguments passed to func
+            
+        Returns:
+            The value returned by func
+        """
+        with self._bus_lock:
+            return func(*args)
+    
+    async def read_register_block_async(self, address: int, length: int,
+                                        into: Optional[bytearray] = None) -> bytearray:
+        """
+        Read a block of consecutive registers without blocking the event loop.
+        
+        The transfer runs in a worker thread, so reads on different buses can
+        overlap while reads on this bus are serialized by a per-bus lock.
+        
+        Args:
+            address: The first memory address to read from
+            length: Number of bytes to read
+            into: Optional preallocated buffer (at least length bytes) to fill in place
+            
+        Returns:
+            The buffer holding the values read (into, when provided)
+        """
+        return await asyncio.to_thread(self.run_exclusive, self.read_register_block,
+                                       address, length, into)
+    
     def write_register(self, address: int, value: int) -> None:
         """
         Write a value to a specific memory address via I2C.
@@ -16,6 +16,17 @@ def read_i2c(address: int) -> int:
     # TODO: Implement actual hardware access
     raise NotImplementedError("Hardware access not implemented")
 
+def read_i2c_block(address: int, buffer: memoryview) -> None:
+    """
+    Read consecutive values starting at the specified I2C address.
+    
+    Args:
+        address: The first memory address to read from
+        buffer: Writable buffer filled in place; its length sets the read size
+    """
+    # TODO: Implement actual hardware access
+    raise NotImplementedError("Hardware access not implemented")
+
 def write_i2c(address: int, value: int) -> None:
     """
     Write a value to the specified I2C address.
@@ -2,7 +2,8 @@ from .base import (
     BaseModule,
     ModuleCapability,
     ModuleStatus,
-    ModuleIdentification
+    ModuleIdentification,
+    poll_all
 )
 from .sff import SFFModule
 from .cmis import CMISModule
@@ -12,6 +13,7 @@ __all__ = [
     'ModuleCapability',
     'ModuleStatus',
     'ModuleIdentification',
+    'poll_all',
     'SFFModule',
     'CMISModule'
 ]
\ No newline at end of file
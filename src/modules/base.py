@@ -2,10 +2,11 @@
 Base class for pluggable module implementations.
 Defines the common interface and functionality for all module types.
 """
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, Iterable, List, Optional, Any, Set
 
 from ..hardware import HardwareInterface
 from ..detection import ModuleType
@@ -103,6 +104,20 @@ class BaseModule(ABC):
         """
         pass
     
+    async def get_status_async(self) -> ModuleStatus:
+        """
+        Get the current status of the module without blocking the event loop.
+        
+        The default implementation runs get_status() in a worker thread while
+        holding the bus lock, so it is serialized with other modules' async
+        reads on the same hardware interface. Implementations with
+        asynchronous hardware access should override it.
+        
+        Returns:
+            Current module status
+        """
+        return await asyncio.to_thread(self.hw.run_exclusive, self.get_status)
+    
     @abstractmethod
     def get_capabilities(self) -> Set[ModuleCapability]:
         """
@@ -175,4 +190,19 @@ class BaseModule(ABC):
             ident = self.get_identification()
             return f"{ident.type.name} Module: {ident.vendor_name} {ident.part_number} Rev {ident.revision}"
         except Exception:
-            return f"Unknown Module"
\ No newline at end of file
+            return f"Unknown Module"
+
+async def poll_all(modules: Iterable[BaseModule]) -> List[ModuleStatus]:
+    """
+    Read the status of several modules concurrently.
+    
+    Modules on separate buses are polled in parallel, so total poll time
+    tracks the slowest bus rather than the sum of all of them.
+    
+    Args:
+        modules: The modules to poll
+        
+    Returns:
+        Module statuses, in the same order as modules
+    """
+    return list(await asyncio.gather(*(module.get_status_async() for module in modules)))
\ No newline at end of file
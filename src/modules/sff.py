@@ -2,15 +2,55 @@
 SFF module implementation.
 Supports SFF-8472 and SFF-8636 compliant modules.
 """
+import functools
+import inspect
 import struct
 import time
-from typing import Dict, List, Optional, Set, Any, Tuple, cast
+from typing import Callable, Dict, List, Optional, Set, Any, Tuple, TypeVar, cast
 
 from ..hardware import HardwareInterface, GPIOSignal
 from ..memory_map import SFFRegisters
 from ..detection import ModuleType
 from .base import BaseModule, ModuleCapability, ModuleStatus, ModuleIdentification
 
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+# Temperature, voltage, TX bias, TX power, RX power (A2h bytes 96-105)
+_DIAG_WORDS = struct.Struct('>5H')
+# Temperature high/low and voltage high/low alarm thresholds (A2h bytes 0-7)
+_THRESHOLD_WORDS = struct.Struct('>4H')
+# A0h identification span, from vendor name (byte 20) through serial number (byte 83)
+_ID_START = SFFRegisters.VENDOR_NAME.offset
+_ID_SIZE = SFFRegisters.VENDOR_SN.offset + 16 - _ID_START
+# Bytes outside printable ASCII, dropped when decoding string fields
+_NON_PRINTABLE = bytes(b for b in range(256) if not 32 <= b <= 126)
+
+def _translate_errors(message: str) -> Callable[[_F], _F]:
+    """
+    Wrap a module operation so any failure surfaces as a RuntimeError.
+    
+    Args:
+        message: Prefix for the RuntimeError message
+    """
+    def decorator(func: _F) -> _F:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    raise RuntimeError(f"{message}: {str(e)}") from e
+            return cast(_F, async_wrapper)
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                raise RuntimeError(f"{message}: {str(e)}") from e
+        return cast(_F, wrapper)
+    return decorator
+
 class SFFModule(BaseModule):
     """Implementation of SFF-compliant optical modules"""
     
@@ -39,6 +79,11 @@ class SFFModule(BaseModule):
             ModuleCapability.RX_LOS,
             ModuleCapability.ALARM_THRESHOLDS
         }
+        
+        # Reusable buffers for block reads so polling does not allocate
+        self._status_buf = bytearray(_DIAG_WORDS.size)
+        self._id_buf = bytearray(_ID_SIZE)
+        self._thresh_buf = bytearray(_THRESHOLD_WORDS.size)
     
     def initialize(self) -> None:
         """
@@ -62,6 +107,7 @@ class SFFModule(BaseModule):
             missing = self._required_capabilities - self._supported_capabilities
             raise RuntimeError(f"Module missing required capabilities: {missing}")
     
+    @_translate_errors("Failed to read module identification")
     def get_identification(self) -> ModuleIdentification:
         """
         Get the module's identification information.
@@ -72,23 +118,22 @@ class SFFModule(BaseModule):
         Raises:
             RuntimeError: If reading identification fails
         """
-        try:
-            # Read basic identification fields
-            vendor_name = self._read_string(SFFRegisters.VENDOR_NAME.offset, 16)
-            part_number = self._read_string(SFFRegisters.VENDOR_PN.offset, 16)
-            serial_number = self._read_string(SFFRegisters.VENDOR_SN.offset, 16)
-            revision = self._read_string(SFFRegisters.VENDOR_REV.offset, 4)
-            
-            return ModuleIdentification(
-                type=ModuleType.SFF,
-                vendor_name=vendor_name.strip(),
-                part_number=part_number.strip(),
-                serial_number=serial_number.strip(),
-                revision=revision.strip()
-            )
-        except Exception as e:
-            raise RuntimeError(f"Failed to read module identification: {str(e)}")
+        # Read all identification fields in one transaction
+        self.hw.read_register_block(_ID_START, _ID_SIZE, into=self._id_buf)
+        vendor_name = self._decode_string(SFFRegisters.VENDOR_NAME.offset, 16)
+        part_number = self._decode_string(SFFRegisters.VENDOR_PN.offset, 16)
+        serial_number = self._decode_string(SFFRegisters.VENDOR_SN.offset, 16)
+        revision = self._decode_string(SFFRegisters.VENDOR_REV.offset, 4)
+        
+        return ModuleIdentification(
+            type=ModuleType.SFF,
+            vendor_name=vendor_name.strip(),
+            part_number=part_number.strip(),
+            serial_number=serial_number.strip(),
+            revision=revision.strip()
+        )
     
+    @_translate_errors("Failed to read module status")
     def get_status(self) -> ModuleStatus:
         """
         Get the current status of the module.
@@ -99,31 +144,54 @@ class SFFModule(BaseModule):
         Raises:
             RuntimeError: If reading status fails
         """
+        # Read all diagnostic words in one transaction
+        self.hw.read_register_block(SFFRegisters.TEMPERATURE.offset, _DIAG_WORDS.size,
+                                    into=self._status_buf)
+        return self._decode_status(self._status_buf)
+    
+    @_translate_errors("Failed to read module status")
+    async def get_status_async(self) -> ModuleStatus:
+        """
+        Get the current status of the module without blocking the event loop.
+        
+        Returns:
+            Current module status
+        
+        Raises:
+            RuntimeError: If reading status fails
+        """
+        # Read into a fresh buffer: the bus lock is released before decoding, so
+        # a shared buffer could be overwritten by a concurrent poll of this module
+        raw = await self.hw.read_register_block_async(SFFRegisters.TEMPERATURE.offset,
+                                                      _DIAG_WORDS.size)
+        return self._decode_status(raw)
+    
+    def _decode_status(self, raw: bytearray) -> ModuleStatus:
+        """
+        Decode a diagnostic block read into a ModuleStatus.
+        
+        Args:
+            raw: The diagnostic words as read from A2h bytes 96-105
+        """
         status = ModuleStatus()
+        raw_temp, raw_voltage, raw_bias, raw_tx_power, raw_rx_power = \
+            _DIAG_WORDS.unpack_from(raw)
         
-        try:
-            # Read temperature (mandatory capability)
-            raw_temp = self._read_word(SFFRegisters.TEMPERATURE.offset)
-            status.temperature = self._decode_temperature(raw_temp)
-            
-            # Read voltage (mandatory capability)
-            raw_voltage = self._read_word(SFFRegisters.VOLTAGE.offset)
-            status.voltage = self._decode_voltage(raw_voltage)
-            
-            # Read optional monitoring values if supported
-            if self.has_capability(ModuleCapability.TX_BIAS_MONITORING):
-                status.tx_bias = [self._decode_bias(self._read_word(SFFRegisters.TX_BIAS.offset))]
-                
-            if self.has_capability(ModuleCapability.TX_POWER_MONITORING):
-                status.tx_power = [self._decode_power(self._read_word(SFFRegisters.TX_POWER.offset))]
-                
-            if self.has_capability(ModuleCapability.RX_POWER_MONITORING):
-                status.rx_power = [self._decode_power(self._read_word(SFFRegisters.RX_POWER.offset))]
+        # Temperature and voltage are mandatory capabilities
+        status.temperature = self._decode_temperature(raw_temp)
+        status.voltage = self._decode_voltage(raw_voltage)
+        
+        # Report optional monitoring values if supported
+        if self.has_capability(ModuleCapability.TX_BIAS_MONITORING):
+            status.tx_bias = [self._decode_bias(raw_bias)]
             
-            return status
+        if self.has_capability(ModuleCapability.TX_POWER_MONITORING):
+            status.tx_power = [self._decode_power(raw_tx_power)]
             
-        except Exception as e:
-            raise RuntimeError(f"Failed to read module status: {str(e)}")
+        if self.has_capability(ModuleCapability.RX_POWER_MONITORING):
+            status.rx_power = [self._decode_power(raw_rx_power)]
+        
+        return status
     
     def get_capabilities(self) -> Set[ModuleCapability]:
         """
@@ -134,6 +202,7 @@ class SFFModule(BaseModule):
         """
         return self._supported_capabilities
     
+    @_translate_errors("Failed to reset module")
     def reset(self) -> None:
         """
         Reset the module using the hardware reset signal.
@@ -141,11 +210,8 @@ class SFFModule(BaseModule):
         Raises:
             RuntimeError: If reset fails
         """
-        try:
-            self.hw.reset_module()
-            time.sleep(0.5)  # Wait for module to stabilize
-        except Exception as e:
-            raise RuntimeError(f"Failed to reset module: {str(e)}")
+        self.hw.reset_module()
+        time.sleep(0.5)  # Wait for module to stabilize
     
     def get_configuration(self) -> Dict[str, Any]:
         """
@@ -225,17 +291,10 @@ class SFFModule(BaseModule):
             # Log warning but continue - we'll work with just required capabilities
             print(f"Warning: Error detecting optional capabilities: {str(e)}")
     
-    def _read_string(self, start_address: int, length: int) -> str:
-        """Read a string from consecutive memory addresses"""
-        bytes_data = []
-        for offset in range(length):
-            try:
-                byte = self.hw.read_register(start_address + offset)
-                bytes_data.append(byte)
-            except Exception:
-                break
-                
-        return "".join(chr(b) for b in bytes_data if 32 <= b <= 126)
+    def _decode_string(self, start_address: int, length: int) -> str:
+        """Decode a string field from the identification buffer"""
+        start = start_address - _ID_START
+        return self._id_buf[start:start + length].translate(None, _NON_PRINTABLE).decode('ascii')
     
     def _read_word(self, address: int) -> int:
         """Read a 16-bit word from memory"""
@@ -277,13 +336,17 @@ class SFFModule(BaseModule):
         """Read all alarm thresholds"""
         thresholds = {}
         
+        self.hw.read_register_block(SFFRegisters.TEMP_HIGH_ALARM.offset, _THRESHOLD_WORDS.size,
+                                    into=self._thresh_buf)
+        temp_high, temp_low, voltage_high, voltage_low = _THRESHOLD_WORDS.unpack_from(self._thresh_buf)
+        
         # Temperature thresholds
-        thresholds["temp_high"] = self._decode_temperature(self._read_word(SFFRegisters.TEMP_HIGH_ALARM.offset))
-        thresholds["temp_low"] = self._decode_temperature(self._read_word(SFFRegisters.TEMP_LOW_ALARM.offset))
+        thresholds["temp_high"] = self._decode_temperature(temp_high)
+        thresholds["temp_low"] = self._decode_temperature(temp_low)
         
         # Voltage thresholds
-        thresholds["voltage_high"] = self._decode_voltage(self._read_word(SFFRegisters.VOLTAGE_HIGH_ALARM.offset))
-        thresholds["voltage_low"] = self._decode_voltage(self._read_word(SFFRegisters.VOLTAGE_LOW_ALARM.offset))
+        thresholds["voltage_high"] = self._decode_voltage(voltage_high)
+        thresholds["voltage_low"] = self._decode_voltage(voltage_low)
         
         return thresholds
     
@@ -1,6 +1,7 @@
 """
 Test configuration and fixtures for the module management system.
 """
+import dataclasses
 import os
 import pytest
 from typing import Generator, Dict, Any
@@ -22,7 +23,7 @@ def pytest_configure(config):
         "markers", "hardware: mark test as requiring hardware interface"
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def module_config() -> ModuleConfig:
     """Provide basic module configuration for testing"""
     return ModuleConfig(
@@ -41,24 +42,28 @@ def module_config() -> ModuleConfig:
         max_case_temp=70.0
     )
 
+def _copy_config(config: ModuleConfig) -> ModuleConfig:
+    """Copy the shared session config so a test that edits its module's config cannot leak into others"""
+    return dataclasses.replace(config, supported_rates=list(config.supported_rates))
+
 @pytest.fixture
 def sff_module(module_config: ModuleConfig) -> Generator[SFFEmulatedModule, None, None]:
     """Provide an emulated SFF module for testing"""
-    module = SFFEmulatedModule(module_config)
+    module = SFFEmulatedModule(_copy_config(module_config))
     yield module
 
 @pytest.fixture
 def cmis_module(module_config: ModuleConfig) -> Generator[CMISEmulatedModule, None, None]:
     """Provide an emulated CMIS module for testing"""
-    module = CMISEmulatedModule(module_config)
+    module = CMISEmulatedModule(_copy_config(module_config))
     yield module
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def temp_value() -> float:
     """Provide a valid temperature value for testing"""
     return 45.0  # degrees C
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def voltage_value() -> float:
     """Provide a valid voltage value for testing"""
     return 3.3  # volts
@@ -21,10 +21,19 @@ management software through a complete emulation of I2C and GPIO interfaces.
 of various types of pluggable modules, including the base EmulatedModule class,
 memory map handling, and configuration structures.
 """
+import random
+import struct
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Dict, Optional, List, Any
+from enum import Enum, IntFlag, auto
+from typing import Dict, Iterator, Optional, List, Any, Set, Tuple, Union
+
+## Big-endian 16-bit word layout used by all monitoring registers
+WORD_LAYOUT = struct.Struct('>H')
+## Adjacent temperature and supply voltage monitor words
+TEMP_VOLTAGE_LAYOUT = struct.Struct('>2H')
 
 class EmulationError(Exception):
     """!
@@ -80,6 +89,26 @@ class MediaType(Enum):
     SR = "SR (850nm MMF)"              #!< Short Reach (850nm over MMF)
     LR = "LR (1310nm SMF)"             #!< Long Reach (1310nm over SMF)
 
+class GpioSignal(IntFlag):
+    """!
+    Module-side GPIO signals, as bits of the module's GPIO state word.
+    """
+    MOD_PRESENT = 0x01  #!< Module present
+    INTERRUPT = 0x02    #!< Module interrupt request
+    RESET = 0x04        #!< Module reset
+    LPMODE = 0x08       #!< Low power mode
+
+## Pin names accepted by the string-keyed GPIO API, mapped to their state bits
+_GPIO_SIGNAL_BITS: Dict[str, int] = {
+    'mod_present': GpioSignal.MOD_PRESENT.value,
+    'interrupt': GpioSignal.INTERRUPT.value,
+    'reset': GpioSignal.RESET.value,
+    'lpmode': GpioSignal.LPMODE.value,
+}
+
+## Media types without optical monitoring (no TX/RX power or bias)
+COPPER_MEDIA_TYPES = frozenset({MediaType.COPPER_PASSIVE, MediaType.COPPER_ACTIVE})
+
 @dataclass
 class ModuleConfig:
     """!
@@ -123,6 +152,15 @@ class ModuleConfig:
     max_power_draw: float       #!< Maximum power consumption in Watts
     length_meters: Optional[float] = None  #!< Cable length in meters (for copper cables)
     wavelength_nm: Optional[float] = None  #!< Operating wavelength in nanometers (for optical modules)
+    
+    @property
+    def is_optical(self) -> bool:
+        """!
+        Whether the media carries optical monitoring (TX/RX power and bias).
+        
+        @return False for copper media, True otherwise
+        """
+        return self.media_type not in COPPER_MEDIA_TYPES
 
 class MemoryMap:
     """!
@@ -158,24 +196,97 @@ class MemoryMap:
         Creates a new memory map with an initial page 0. Additional pages
         can be added using the add_page() method.
         """
-        ## Dictionary mapping page numbers to byte arrays
-        self._pages: Dict[int, bytearray] = {0: bytearray(size)}
+        ## Contiguous backing store holding every page back to back
+        self._buffer = bytearray(size)
+        ## Dictionary mapping page numbers to their base offset in the backing store
+        self._page_index: Dict[int, int] = {0: 0}
         ## Currently selected memory page
         self._current_page = 0
+        ## Base offset of the currently selected page
+        self._current_base = 0
         ## Size of each memory page in bytes
         self._size = size
+        ## Shared all-zero page image used to extend the backing store
+        self._blank_page = bytes(size)
+        ## Declared pages whose storage is allocated on first access
+        self._lazy_pages: Set[int] = set()
     
-    def add_page(self, page_number: int) -> None:
+    def add_page(self, page_number: int, lazy: bool = False) -> None:
         """!
         Add a new memory page to the map.
         
         @param page_number The page number to add (e.g., 0xA0, 0xA2)
+        @param lazy Defer allocating the page until it is first selected or accessed
         
         Creates a new page initialized to all zeros. If the page already exists,
-        this method has no effect.
+        this method has no effect. A lazy page reads as all zeros either way, so
+        rarely used pages can be declared without paying for their storage.
+        """
+        if page_number in self._page_index:
+            return
+        if lazy:
+            self._lazy_pages.add(page_number)
+        else:
+            self._lazy_pages.discard(page_number)
+            self._allocate_page(page_number)
+    
+    def is_allocated(self, page_number: int) -> bool:
+        """!
+        Check whether a page currently has storage in the backing store.
+        
+        @param page_number The page number to check
+        @return True once the page is added eagerly or a lazy page is first used
+        """
+        return page_number in self._page_index
+    
+    def _allocate_page(self, page_number: int) -> int:
+        """!
+        Append a zeroed page to the backing store.
+        
+        @param page_number The page number to allocate
+        @return Base offset of the new page
+        """
+        base = self._page_index[page_number] = len(self._buffer)
+        self._buffer.extend(self._blank_page)
+        return base
+    
+    def _page_base(self, page_number: int) -> int:
+        """!
+        Look up a page's base offset, allocating a lazy page on first use.
+        
+        @param page_number The page number to look up
+        @return Base offset of the page in the backing store
+        @throws EmulationError if the page does not exist
+        """
+        base = self._page_index.get(page_number)
+        if base is None:
+            if page_number not in self._lazy_pages:
+                raise EmulationError(f"Page {page_number} does not exist")
+            self._lazy_pages.discard(page_number)
+            base = self._allocate_page(page_number)
+        return base
+    
+    def load_page(self, page_number: int, data: bytes) -> None:
+        """!
+        Replace the whole contents of a page with a prebuilt image.
+        
+        @param page_number The page number to load; it is added if missing
+        @param data Page image (any C-contiguous buffer) of at most the page size
+        @throws EmulationError if the image is larger than a page
+        
+        Bytes beyond the end of a shorter image are cleared, so the page ends
+        up exactly as described by the image. The page selection is unchanged.
         """
-        if page_number not in self._pages:
-            self._pages[page_number] = bytearray(self._size)
+        data = memoryview(data).cast('B')
+        length = data.nbytes
+        if length > self._size:
+            raise EmulationError(f"Page image of {length} bytes exceeds page size")
+        base = self._page_index.get(page_number)
+        if base is None:
+            self._lazy_pages.discard(page_number)
+            base = self._allocate_page(page_number)
+        self._buffer[base:base + length] = data
+        self._buffer[base + length:base + self._size] = self._blank_page[length:]
     
     @property
     def current_page(self) -> int:
@@ -196,10 +307,24 @@ class MemoryMap:
         All subsequent read and write operations will access the selected page
         until a different page is selected.
         """
-        if page not in self._pages:
-            raise EmulationError(f"Page {page} does not exist")
+        self._current_base = self._page_base(page)
         self._current_page = page
     
+    def get_page(self, page_number: int) -> Tuple[bytearray, int]:
+        """!
+        Get direct access to a page without changing the page selection.
+        
+        @param page_number The page number to access
+        @return Tuple of (backing store, base offset of the page)
+        @throws EmulationError if the page does not exist
+        
+        Intended for internal refresh paths that update several pages per call.
+        Callers address the page as buffer[base + address], e.g. with
+        struct.pack_into(); the page selection seen by external register
+        accesses is left untouched.
+        """
+        return self._buffer, self._page_base(page_number)
+    
     def read_byte(self, address: int) -> int:
         """!
         Read a byte from the current page.
@@ -213,7 +338,7 @@ class MemoryMap:
         """
         if not 0 <= address < self._size:
             raise EmulationError(f"Address {address} out of range")
-        return self._pages[self._current_page][address]
+        return self._buffer[self._current_base + address]
     
     def write_byte(self, address: int, value: int) -> None:
         """!
@@ -230,25 +355,60 @@ class MemoryMap:
             raise EmulationError(f"Address {address} out of range")
         if not 0 <= value <= 255:
             raise EmulationError(f"Value {value} out of range")
-        self._pages[self._current_page][address] = value
+        self._buffer[self._current_base + address] = value
+    
+    def write_word_page(self, page: int, address: int, value: int) -> None:
+        """!
+        Write a 16-bit word to a specific page without changing the page selection.
+        
+        @param page The page number to write to
+        @param address Memory address for MSB (LSB will be at address+1)
+        @param value 16-bit value to write
+        @throws EmulationError if the page does not exist or address/value is out of range
+        """
+        if not 0 <= address < self._size - 1:
+            raise EmulationError(f"Address {address} out of range for word access")
+        if not 0 <= value <= 65535:
+            raise EmulationError(f"Value {value} out of range for word")
+        WORD_LAYOUT.pack_into(self._buffer, self._page_base(page) + address, value)
+    
+    def read_bytes(self, start_address: int, count: int) -> bytes:
+        """!
+        Read multiple consecutive bytes starting at an address.
+        
+        @param start_address Starting memory address
+        @param count Number of bytes to read
+        @return The bytes read from the currently selected page
+        @throws EmulationError if the operation would exceed page boundaries
+        """
+        if not 0 <= start_address < self._size:
+            raise EmulationError(f"Start address {start_address} out of range")
+        if not 0 <= count <= self._size - start_address:
+            raise EmulationError("Read would exceed page size")
+        base = self._current_base + start_address
+        return bytes(self._buffer[base:base + count])
     
     def write_bytes(self, start_address: int, data: bytes) -> None:
         """!
         Write multiple consecutive bytes starting at an address.
         
         @param start_address Starting memory address
-        @param data Bytes to write
+        @param data Data to write; any C-contiguous buffer (bytes, bytearray,
+                    memoryview, array.array, or an externally produced ndarray)
         @throws EmulationError if the operation would exceed page boundaries
         
         Writes a sequence of bytes to consecutive addresses starting at
-        the specified address in the currently selected page.
+        the specified address in the currently selected page. Typed buffers
+        are copied as their raw bytes without an intermediate bytes object.
         """
         if not 0 <= start_address < self._size:
             raise EmulationError(f"Start address {start_address} out of range")
-        if start_address + len(data) > self._size:
+        data = memoryview(data).cast('B')
+        end_address = start_address + data.nbytes
+        if end_address > self._size:
             raise EmulationError("Data would exceed page size")
-        for i, value in enumerate(data):
-            self._pages[self._current_page][start_address + i] = value
+        base = self._current_base
+        self._buffer[base + start_address:base + end_address] = data
     
     def read_word(self, address: int) -> int:
         """!
@@ -263,9 +423,7 @@ class MemoryMap:
         """
         if not 0 <= address < self._size - 1:
             raise EmulationError(f"Address {address} out of range for word access")
-        msb = self.read_byte(address)
-        lsb = self.read_byte(address + 1)
-        return (msb << 8) | lsb
+        return WORD_LAYOUT.unpack_from(self._buffer, self._current_base + address)[0]
     
     def write_word(self, address: int, value: int) -> None:
         """!
@@ -282,10 +440,7 @@ class MemoryMap:
             raise EmulationError(f"Address {address} out of range for word access")
         if not 0 <= value <= 65535:
             raise EmulationError(f"Value {value} out of range for word")
-        msb = (value >> 8) & 0xFF
-        lsb = value & 0xFF
-        self.write_byte(address, msb)
-        self.write_byte(address + 1, lsb)
+        WORD_LAYOUT.pack_into(self._buffer, self._current_base + address, value)
 
 class EmulatedModule(ABC):
     """!
@@ -319,6 +474,9 @@ class EmulatedModule(ABC):
     @endcode
     """
     
+    ## Largest voltage offset (V) a monitoring refresh adds to the set voltage
+    _VOLTAGE_VARIATION = 0.0
+    
     def __init__(self, config: ModuleConfig):
         """!
         Initialize emulated module.
@@ -331,12 +489,11 @@ class EmulatedModule(ABC):
         """
         self.config = config
         self.memory_map = MemoryMap()
-        self._gpio_states = {
-            'mod_present': True,
-            'interrupt': False,
-            'reset': False,
-            'lpmode': False
-        }
+        # Bound page accessor used by every monitoring refresh
+        self._mm_get_page = self.memory_map.get_page
+        self._is_copper = not config.is_optical
+        # GPIO signal states as a GpioSignal bitfield
+        self._gpio_bits = GpioSignal.MOD_PRESENT.value
         self._temperature = 25.0  # Default temperature in Celsius
         self._voltage = 3.3      # Default voltage in V
         
@@ -349,11 +506,18 @@ class EmulatedModule(ABC):
         self._rx_power_mw = 0.0
         
         # Set default monitoring values based on module type
-        if not config.media_type.name.startswith('COPPER'):
+        if not self._is_copper:
             self._tx_bias_ma = 30.0  # Typical bias current
             self._tx_power_mw = 0.5   # Typical TX power
             self._rx_power_mw = 0.4   # Typical RX power
         
+        # Private generator for monitoring noise, independent of the global random state
+        self._rng = random.Random()
+        
+        # Monitoring refreshes deferred until the next register read or batch() exit
+        self._batch_depth = 0
+        self._monitoring_dirty = False
+        
         self._initialize_memory_map()
     
     @abstractmethod
@@ -394,64 +558,152 @@ class EmulatedModule(ABC):
         return self._voltage
 
     def set_temperature(self, temperature: float) -> None:
-        """Set module temperature"""
+        """Set module temperature; the memory map catches up on the next register read"""
         self._temperature = temperature
-        self.update_monitoring()
+        self._request_monitoring_update()
 
     def set_voltage(self, voltage: float) -> None:
-        """Set module voltage"""
+        """Set module voltage; the memory map catches up on the next register read"""
+        self._check_voltage(voltage)
         self._voltage = voltage
-        self.update_monitoring()
+        self._request_monitoring_update()
 
-    def get_gpio_state(self, signal: str) -> bool:
-        """Get state of a GPIO signal"""
-        if signal not in self._gpio_states:
-            raise EmulationError(f"Unknown GPIO signal: {signal}")
-        return self._gpio_states[signal]
-    
-    def set_gpio_state(self, signal: str, state: bool) -> None:
-        """Set state of a GPIO signal"""
-        if signal not in self._gpio_states:
-            raise EmulationError(f"Unknown GPIO signal: {signal}")
-        self._gpio_states[signal] = state
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """!
+        Coalesce the monitoring refreshes of several setters into one.
+        
+        Setters only mark monitoring as stale, and the refresh normally runs on
+        the next register read. Inside the block even reads leave it pending;
+        a single update_monitoring() runs when the outermost batch exits so the
+        memory map is current afterwards. Batches nest.
+        
+        Example:
+        @code
+        with module.batch():
+            module.set_temperature(45.0)
+            module.set_voltage(3.3)
+        @endcode
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._maybe_refresh()
+
+    def _request_monitoring_update(self) -> None:
+        """!
+        Mark monitoring as stale; it is refreshed on the next register read.
+        
+        Only reads through read_register() or the emulated I2C bus, and the
+        exit of a batch(), apply the refresh. Code that inspects memory_map
+        directly after a setter sees the previous values until it calls
+        update_monitoring() itself.
+        """
+        self._monitoring_dirty = True
+
+    def _maybe_refresh(self) -> None:
+        """Run a pending monitoring refresh unless a batch() is still open"""
+        if self._monitoring_dirty and not self._batch_depth:
+            self.update_monitoring()
+            # Only a completed refresh clears the flag, so a failed one is retried
+            self._monitoring_dirty = False
+
+    def get_gpio_state(self, signal: Union[str, GpioSignal]) -> bool:
+        """Get state of a GPIO signal (pin name or GpioSignal)"""
+        return bool(self._gpio_bits & self._gpio_bit(signal))
+    
+    def set_gpio_state(self, signal: Union[str, GpioSignal], state: bool) -> None:
+        """Set state of a GPIO signal (pin name or GpioSignal)"""
+        bit = self._gpio_bit(signal)
+        if state:
+            self._gpio_bits |= bit
+        else:
+            self._gpio_bits &= ~bit
         
         # Handle special signals
-        if signal == 'reset' and state:
+        if bit == GpioSignal.RESET.value and state:
             self._handle_reset()
     
+    @staticmethod
+    def _gpio_bit(signal: Union[str, GpioSignal]) -> int:
+        """Resolve a pin name or GpioSignal to its state bit"""
+        if isinstance(signal, GpioSignal):
+            return signal.value
+        bit = _GPIO_SIGNAL_BITS.get(signal)
+        if bit is None:
+            raise EmulationError(f"Unknown GPIO signal: {signal}")
+        return bit
+    
     def read_register(self, address: int) -> int:
         """Read from module's memory map"""
+        self._maybe_refresh()
         return self.memory_map.read_byte(address)
     
     def write_register(self, address: int, value: int) -> None:
         """Write to module's memory map"""
         self.memory_map.write_byte(address, value)
     
+    def write_registers(self, start_address: int, data: bytes) -> None:
+        """Write consecutive bytes to module's memory map"""
+        self.memory_map.write_bytes(start_address, data)
+    
     def _handle_reset(self) -> None:
         """Handle module reset"""
         # Re-initialize memory map
         self._initialize_memory_map()
         # Reset GPIO states except mod_present
-        self._gpio_states.update({
-            'interrupt': False,
-            'reset': False,
-            'lpmode': False
-        })
+        self._gpio_bits &= GpioSignal.MOD_PRESENT.value
+
+    def _write_temp_voltage(self, page: int, address: int, temperature: float, voltage: float) -> None:
+        """!
+        Encode and write the adjacent temperature and voltage monitor words as one block.
+        
+        @throws EmulationError if an encoded value does not fit in a word
+        """
+        buffer, base = self._mm_get_page(page)
+        try:
+            TEMP_VOLTAGE_LAYOUT.pack_into(buffer, base + address,
+                                          self._encode_temperature(temperature),
+                                          self._encode_voltage(voltage))
+        except struct.error as e:
+            raise EmulationError(f"Temperature {temperature} or voltage {voltage} "
+                                 f"out of range for word: {e}") from e
     
     def _encode_temperature(self, temp: float) -> int:
         """Encode temperature value for memory map"""
-        # Convert to 16-bit signed value in 1/256 degree units
-        # Round to nearest 1/256 to avoid precision loss
-        val = round(temp * 256.0)
-        # Handle negative temperatures correctly
-        if val < 0:
-            val = val & 0xFFFF  # Convert to unsigned 16-bit
-        return val & 0xFFFF  # Ensure 16-bit unsigned value
+        # Convert to 16-bit signed value in 1/256 degree units, rounded to the
+        # nearest step; masking yields the two's-complement form for negatives
+        return round(temp * 256.0) & 0xFFFF
     
     def _encode_voltage(self, voltage: float) -> int:
         """Encode voltage value for memory map"""
         return int(voltage * 10000.0)  # Convert to units of 100µV
     
+    def _check_voltage(self, voltage: float) -> int:
+        """!
+        Encode a voltage, rejecting values that do not fit the monitor word.
+        
+        @param voltage Voltage in volts
+        @return The encoded voltage word
+        @throws EmulationError if the encoded value is out of range for a word
+        
+        Setters call this up front so a bad value fails at the call site rather
+        than in the deferred monitoring refresh. The check allows for the
+        module's _VOLTAGE_VARIATION, so an accepted value cannot overflow once
+        a refresh adds its random offset.
+        """
+        value = self._encode_voltage(voltage)
+        if not 0 <= value <= 0xFFFF:
+            raise EmulationError(f"Value {value} out of range for word")
+        margin = self._VOLTAGE_VARIATION
+        if not (0 <= self._encode_voltage(voltage - margin)
+                and self._encode_voltage(voltage + margin) <= 0xFFFF):
+            raise EmulationError(f"Voltage {voltage} out of range for word "
+                                 f"with ±{margin}V monitoring variation")
+        return value
+    
     def _encode_power(self, power: float) -> int:
         """Encode optical power value for memory map"""
         # Clamp power to non-negative value
@@ -463,18 +715,16 @@ class EmulatedModule(ABC):
         """Encode bias current value for memory map"""
         return int(bias * 500.0)  # Convert to units of 2µA
     
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _pad_ascii(string: str, max_length: int) -> bytes:
+        """Encode a string as a null-terminated, zero-padded field of max_length bytes"""
+        # Limit length to max_length - 1 to leave room for null termination
+        return string.encode('ascii')[:max_length-1].ljust(max_length, b'\x00')
+    
     def _write_string(self, start_address: int, string: str, max_length: int) -> None:
         """Write a string to memory map with null termination"""
-        # Convert string to bytes, limiting length to max_length - 1 to leave room for null termination
-        encoded = string.encode('ascii')[:max_length-1]
-        # Write string bytes
-        self.memory_map.write_bytes(start_address, encoded)
-        # Add null terminator
-        self.memory_map.write_byte(start_address + len(encoded), 0)
-        # Fill remaining space with zeros
-        remaining = max_length - len(encoded) - 1
-        if remaining > 0:
-            self.memory_map.write_bytes(start_address + len(encoded) + 1, b'\x00' * remaining)
+        self.memory_map.write_bytes(start_address, self._pad_ascii(string, max_length))
     
     def add_memory_pages(self, pages: List[int]) -> None:
         """Add multiple memory pages"""
@@ -483,5 +733,11 @@ class EmulatedModule(ABC):
     
     @abstractmethod
     def update_monitoring(self) -> None:
-        """Update monitoring values in memory map"""
+        """!
+        Update monitoring values in memory map.
+        
+        Setters do not call this directly; they defer it to the next register
+        read or batch() exit (see _request_monitoring_update). Call it before
+        reading memory_map directly to see the current values.
+        """
         pass
\ No newline at end of file
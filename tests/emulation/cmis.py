@@ -2,10 +2,93 @@
 CMIS module emulator implementation.
 Emulates modules that follow the Common Management Interface Specification.
 """
-import random
-from typing import Dict, List, Optional, Union
+import struct
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, MutableSequence, Optional, Union
 from .base import EmulatedModule, ModuleConfig, EmulationError
 
+# Per-lane TX power, RX power and TX bias words at the start of each lane block
+_LANE_MONITORS = struct.Struct('>3H')
+
+# Simplified bit rate (Gbps) to application code mapping - real modules use
+# standardized application codes
+_APP_CODE_MAP: Mapping[float, int] = MappingProxyType({
+    10.0: 0x1,
+    25.0: 0x2,
+    40.0: 0x3,
+    100.0: 0x4,
+    200.0: 0x5,
+    400.0: 0x6,
+})
+
+@lru_cache(maxsize=None)
+def _compile_monitoring_update(num_channels: int, is_copper: bool):
+    """
+    Generate an update_monitoring function specialized for one module shape.
+
+    The copper/optical branch and the lane loop are resolved at generation
+    time, so the produced function is straight-line code with constant page
+    numbers, lane offsets and disable-mask bits. The lane power and bias
+    encodings (EmulatedModule._encode_power/_encode_bias) are inlined as
+    expressions, so a lane costs one pack call rather than four Python calls.
+    The random draw order matches _update_monitoring_generic. Shapes
+    are cached, so modules with the same channel count and media class share
+    one code object.
+    """
+    lines = [
+        "def update_monitoring(self):",
+        "    if not isinstance(self._tx_power_mw, array):",
+        "        self.initialize_channels()",
+        "    rand = self._rng.random",
+        "    get_page = self._mm_get_page",
+        "    temp_variation = (rand() - 0.5) * 1.0",
+        "    voltage_variation = (rand() - 0.5) * 0.04",
+        "    self._write_temp_voltage(0x00, 0x03, self._temperature + temp_variation,",
+        "                             self._voltage + voltage_variation)",
+    ]
+    if not is_copper:
+        lines += [
+            "    buffer, base = get_page(0x11)",
+            "    tx_power, rx_power, tx_bias = self._tx_power_mw, self._rx_power_mw, self._tx_bias_ma",
+            "    pack_into = _LANE_MONITORS.pack_into",
+            "    disable_mask = self._tx_disable_mask",
+        ]
+        for i in range(num_channels):
+            lines += [
+                "    bias_variation = (rand() - 0.5) * 0.4",
+                "    power_variation = (rand() - 0.5) * 0.02",
+                f"    tx, rx, bias = tx_power[{i}], rx_power[{i}], tx_bias[{i}]",
+                f"    if not disable_mask & {1 << i:#x}:",
+                "        tx += power_variation",
+                "        rx += power_variation",
+                "        bias += bias_variation",
+                f"        tx_power[{i}], rx_power[{i}], tx_bias[{i}] = tx, rx, bias",
+                f"    pack_into(buffer, base + {0x10 + i * 12:#x},",
+                "              int((tx if tx > 0.0 else 0.0) * 10000.0) & 0xFFFF,",
+                "              int((rx if rx > 0.0 else 0.0) * 10000.0) & 0xFFFF,",
+                "              int(bias * 500.0))",
+            ]
+    lines += [
+        "    flags = (0x80 if self._temperature > 70.0 else 0x00) | (0x20 if self._voltage > 3.5 else 0x00)",
+        "    if flags != self._last_flags:",
+        "        buffer, base = get_page(0x83)",
+        "        buffer[base] = flags",
+        "        self._last_flags = flags",
+    ]
+    # Report an out-of-range encoded value the way the memory map accessors do
+    lines = [lines[0], "    try:"] + ["    " + line for line in lines[1:]] + [
+        "    except struct.error as e:",
+        "        raise EmulationError(f'Monitoring value out of range for word: {e}') from e",
+    ]
+    namespace = {'_LANE_MONITORS': _LANE_MONITORS, 'array': array,
+                 'struct': struct, 'EmulationError': EmulationError}
+    variant = 'copper' if is_copper else 'optical'
+    code = compile("\n".join(lines), f"<cmis monitoring {num_channels}x {variant}>", 'exec')
+    exec(code, namespace)
+    return namespace['update_monitoring']
+
 class CMISEmulatedModule(EmulatedModule):
     """
     Emulates a CMIS-compliant module.
@@ -16,15 +99,18 @@ class CMISEmulatedModule(EmulatedModule):
     _SFF8024_ATTR_RX_POWER_OFFSET = 0x30
     _SFF8024_ATTR_TX_BIAS_OFFSET = 0x40
     
+    # Largest voltage offset (V) added by update_monitoring()
+    _VOLTAGE_VARIATION = 0.02
+    
     # Class-level type annotations
-    _tx_bias_ma: List[float]
-    _tx_power_mw: List[float]
-    _rx_power_mw: List[float]
+    _tx_bias_ma: MutableSequence[float]
+    _tx_power_mw: MutableSequence[float]
+    _rx_power_mw: MutableSequence[float]
     
     # Class-level variable for type hints
-    _tx_bias_ma: List[float]
-    _tx_power_mw: List[float]
-    _rx_power_mw: List[float]
+    _tx_bias_ma: MutableSequence[float]
+    _tx_power_mw: MutableSequence[float]
+    _rx_power_mw: MutableSequence[float]
     
     def __init__(self, config: ModuleConfig):
         """Initialize CMIS module emulator"""
@@ -36,17 +122,28 @@ class CMISEmulatedModule(EmulatedModule):
         self._power_class = 1  # Default power class
         self._temperature = 25.0  # Default temperature
         self._voltage = 3.3  # Default voltage
+        self._last_flags: Optional[int] = None  # Flags byte last written to page 0x83
+        # Per-lane monitor block addresses on page 0x11 and lane bit masks
+        self._channel_bases = tuple(0x10 + (i * 12) for i in range(config.num_channels))
+        self._channel_masks = tuple(1 << i for i in range(config.num_channels))
         
-        # Initialize arrays for monitoring values
+        # Initialize arrays for monitoring values; _is_copper itself is set by
+        # EmulatedModule.__init__
+        is_copper = not config.is_optical
         init_value = 0.0
-        if not config.media_type.name.startswith('COPPER'):
+        if not is_copper:
             init_values = {"bias": 30.0, "tx_power": 0.5, "rx_power": 0.4}
         else:
             init_values = {"bias": 0.0, "tx_power": 0.0, "rx_power": 0.0}
             
-        self._tx_bias_ma = [init_values["bias"]] * config.num_channels
-        self._tx_power_mw = [init_values["tx_power"]] * config.num_channels  
-        self._rx_power_mw = [init_values["rx_power"]] * config.num_channels
+        # Per-lane values are packed double arrays rather than lists of float objects
+        self._tx_bias_ma = array('d', [init_values["bias"]]) * config.num_channels
+        self._tx_power_mw = array('d', [init_values["tx_power"]]) * config.num_channels
+        self._rx_power_mw = array('d', [init_values["rx_power"]]) * config.num_channels
+        
+        # Monitoring refresh specialized for this module's shape, called by
+        # update_monitoring(); a plain function, so it holds no reference to self
+        self._monitoring_update = _compile_monitoring_update(config.num_channels, is_copper)
         
         # Call parent class initialization
         super().__init__(config)
@@ -54,50 +151,56 @@ class CMISEmulatedModule(EmulatedModule):
     def initialize_channels(self) -> None:
         """Initialize per-channel values"""
         # Set initial values based on module type
-        if not self.config.media_type.name.startswith('COPPER'):
+        if not self._is_copper:
             init_values = {"bias": 30.0, "tx_power": 0.5, "rx_power": 0.4}
         else:
             init_values = {"bias": 0.0, "tx_power": 0.0, "rx_power": 0.0}
             
         # Initialize arrays with proper values
-        self._tx_bias_ma = [init_values["bias"]] * self.config.num_channels
-        self._tx_power_mw = [init_values["tx_power"]] * self.config.num_channels  
-        self._rx_power_mw = [init_values["rx_power"]] * self.config.num_channels
+        self._tx_bias_ma = array('d', [init_values["bias"]]) * self.config.num_channels
+        self._tx_power_mw = array('d', [init_values["tx_power"]]) * self.config.num_channels
+        self._rx_power_mw = array('d', [init_values["rx_power"]]) * self.config.num_channels
     
     def _initialize_memory_map(self) -> None:
         """Initialize the CMIS memory map"""
+        # The flags page is rebuilt below, so the next refresh must rewrite it
+        self._last_flags = None
+        # Each page is assembled as a local image and loaded in one call
         # Lower Memory Page (Page 0)
-        self.memory_map.write_byte(0x00, self.config.identifier)  # Identifier
-        self._write_string(0x10, self.config.vendor_name, 16)
-        self._write_string(0x20, self.config.part_number, 16)
-        self._write_string(0x30, self.config.revision, 2)
-        self._write_string(0x40, self.config.serial_number, 16)
-        
-        # Status and Control Pages
-        for page in [0x80, 0x81, 0x82, 0x83, 0x84, 0x85]:
-            self.memory_map.add_page(page)
+        lower = bytearray(256)
+        lower[0x00] = self.config.identifier  # Identifier
+        lower[0x10:0x20] = self._pad_ascii(self.config.vendor_name, 16)
+        lower[0x20:0x30] = self._pad_ascii(self.config.part_number, 16)
+        lower[0x30:0x32] = self._pad_ascii(self.config.revision, 2)
+        lower[0x40:0x50] = self._pad_ascii(self.config.serial_number, 16)
+        self.memory_map.load_page(0x00, lower)
         
         # Module Features (Page 0x80)
-        self.memory_map.select_page(0x80)
+        features_page = bytearray(256)
         features = 0x00
-        if not self.config.media_type.name.startswith('COPPER'):
+        if not self._is_copper:
             features |= 0x07  # Power monitoring supported
         if len(self.config.supported_rates) > 1:
             features |= 0x20  # Programmable rates supported
-        self.memory_map.write_byte(0x02, features)
+        features_page[0x02] = features
+        self.memory_map.load_page(0x80, features_page)
         
-        # Application Advertisement (Page 0x10)
-        self.memory_map.add_page(0x10)
-        self.memory_map.select_page(0x10)
+        # Status and Control Pages; those the emulator never writes are
+        # allocated only if a host actually selects them
+        self.memory_map.add_page(0x83)
+        for page in [0x81, 0x82, 0x84, 0x85]:
+            self.memory_map.add_page(page, lazy=True)
         
-        # Write supported rates as application codes
-        for i, rate in enumerate(self.config.supported_rates):
-            app_code = self._encode_application(rate)
-            self.memory_map.write_word(0x20 + (i * 2), app_code)
+        # Application Advertisement and Data Path Configuration (Page 0x10)
+        app_page = bytearray(256)
+        # Power class, then max power in 100mW units
+        struct.pack_into('>BH', app_page, 0x10, self._power_class, int(self.config.max_power_draw * 10))
         
-        # Data Path Configuration (Page 0x10)
-        self.memory_map.write_byte(0x10, self._power_class)
-        self.memory_map.write_word(0x11, int(self.config.max_power_draw * 10))  # Power in 100mW units
+        # Write supported rates as application codes
+        app_codes = [self._encode_application(rate) for rate in self.config.supported_rates]
+        struct.pack_into(f'>{len(app_codes)}H', app_page, 0x20, *app_codes)
+        self._supported_app_codes = frozenset(app_codes)
+        self.memory_map.load_page(0x10, app_page)
         
         # Status/Monitor Pages
         self.memory_map.add_page(0x11)  # Data Path Status/Monitor
@@ -106,127 +209,174 @@ class CMISEmulatedModule(EmulatedModule):
         self.update_monitoring()
     
     def update_monitoring(self) -> None:
-        """Update monitoring values in memory map"""
+        """
+        Update monitoring values in memory map.
+
+        Runs the variant generated for this module's channel count and media
+        class (see _compile_monitoring_update). Setters only mark monitoring
+        stale, so direct memory_map readers must call this first; register
+        reads apply it automatically.
+        
+        Raises:
+            EmulationError: If an encoded monitoring value does not fit its word
+        """
+        self._monitoring_update(self)
+    
+    def _update_monitoring_generic(self) -> None:
+        """
+        Reference implementation of update_monitoring().
+
+        Defines the behaviour the generated variants reproduce;
+        test_cmis_generated_update_matches_generic checks that both write
+        identical pages.
+        """
         # Initialize arrays if needed
-        if not isinstance(self._tx_power_mw, list):
+        if not isinstance(self._tx_power_mw, array):
             self.initialize_channels()
             
-        # Add some random variation
-        temp_variation = random.uniform(-0.5, 0.5)
-        voltage_variation = random.uniform(-0.02, 0.02)
+        # Add some random variation, scaling centred unit draws to each range
+        rand = self._rng.random
+        temp_variation = (rand() - 0.5) * 1.0        # ±0.5°C
+        voltage_variation = (rand() - 0.5) * 0.04    # ±0.02V
         
-        # Update base page monitoring
-        self.memory_map.select_page(0x00)
-        self.memory_map.write_word(0x03, self._encode_temperature(self._temperature + temp_variation))
-        self.memory_map.write_word(0x05, self._encode_voltage(self._voltage + voltage_variation))
+        # Update base page monitoring; pages are written in place so the
+        # register page selection is left untouched
+        self._write_temp_voltage(0x00, 0x03, self._temperature + temp_variation,
+                                 self._voltage + voltage_variation)
         
         # Update per-lane monitoring if applicable
-        if not self.config.media_type.name.startswith('COPPER'):
-            self.memory_map.select_page(0x11)
-            for i in range(self.config.num_channels):
-                base_addr = 0x10 + (i * 12)
-                
+        if not self._is_copper:
+            buffer, base = self._mm_get_page(0x11)
+            tx_power, rx_power, tx_bias = self._tx_power_mw, self._rx_power_mw, self._tx_bias_ma
+            encode_power, encode_bias = self._encode_power, self._encode_bias
+            pack_into = _LANE_MONITORS.pack_into
+            disable_mask = self._tx_disable_mask
+            for i, (lane_base, lane_mask) in enumerate(zip(self._channel_bases, self._channel_masks)):
                 # Add variations and update array values
-                bias_variation = random.uniform(-0.2, 0.2)
-                power_variation = random.uniform(-0.01, 0.01)
+                bias_variation = (rand() - 0.5) * 0.4    # ±0.2mA
+                power_variation = (rand() - 0.5) * 0.02  # ±0.01mW
                 
                 # Update array values with variations
-                if not self._tx_disable_mask & (1 << i):
-                    self._tx_power_mw[i] += power_variation
-                    self._rx_power_mw[i] += power_variation
-                    self._tx_bias_ma[i] += bias_variation
+                if not disable_mask & lane_mask:
+                    tx_power[i] += power_variation
+                    rx_power[i] += power_variation
+                    tx_bias[i] += bias_variation
                 
-                # Write updated values to memory map
-                self.memory_map.write_word(base_addr + 0,
-                    self._encode_power(self._tx_power_mw[i]))
-                self.memory_map.write_word(base_addr + 2,
-                    self._encode_power(self._rx_power_mw[i]))
-                self.memory_map.write_word(base_addr + 4,
-                    self._encode_bias(self._tx_bias_ma[i]))
+                # Write the lane's three monitor words in one block
+                try:
+                    pack_into(buffer, base + lane_base,
+                              encode_power(tx_power[i]), encode_power(rx_power[i]), encode_bias(tx_bias[i]))
+                except struct.error as e:
+                    raise EmulationError(f"Monitoring value out of range for word: {e}") from e
         
         # Update status flags
-        self.memory_map.select_page(0x83)  # Flags page
         flags = 0x00
         # Add temperature and voltage alarm flags if needed
         if self._temperature > 70.0:
             flags |= 0x80  # Temperature high alarm
         if self._voltage > 3.5:
             flags |= 0x20  # Voltage high alarm
-        self.memory_map.write_byte(0x00, flags)
+        # Steady state leaves the flags unchanged; skip rewriting the byte
+        if flags != self._last_flags:
+            buffer, base = self._mm_get_page(0x83)  # Flags page
+            buffer[base] = flags
+            self._last_flags = flags
     
     def set_tx_disable(self, channel: int, disable: bool) -> None:
         """Set TX disable state for a channel"""
         if not 0 <= channel < self.config.num_channels:
             raise EmulationError(f"Invalid channel number: {channel}")
         
-        mask = 1 << channel
-        if disable:
-            self._tx_disable_mask |= mask
-            self._tx_power_mw[channel] = 0.0
-        else:
-            self._tx_disable_mask &= ~mask
-            self._tx_power_mw[channel] = 0.5
+        # Set or clear the lane bit without branching: -True is an all-ones mask
+        mask = self._channel_masks[channel]
+        disable = bool(disable)
+        self._tx_disable_mask = (self._tx_disable_mask & ~mask) | (mask & -disable)
+        self._tx_power_mw[channel] = 0.5 * (not disable)
         
-        self.update_monitoring()
+        # Only this lane's monitors changed; temperature/voltage flags are untouched
+        if not self._is_copper:
+            self._write_channel_triple(channel)
     
     def set_application(self, app_code: int) -> None:
-        """Set active application (data rate)"""
+        """Set active application (data rate); monitoring refreshes on the next register read"""
         # Verify application code is supported
-        self.memory_map.select_page(0x10)
-        supported = False
-        for i in range(len(self.config.supported_rates)):
-            if self.memory_map.read_word(0x20 + (i * 2)) == app_code:
-                supported = True
-                break
-        
-        if not supported:
+        if app_code not in self._supported_app_codes:
             raise EmulationError(f"Unsupported application code: {app_code}")
         
         self._active_application = app_code
-        self.update_monitoring()
+        self._request_monitoring_update()
     
     def simulate_fault(self, channel: int, fault_type: str, state: bool) -> None:
         """Simulate various fault conditions on a specific channel"""
         if not 0 <= channel < self.config.num_channels:
             raise EmulationError(f"Invalid channel number: {channel}")
         
-        if fault_type == 'tx_fault':
-            mask = 1 << channel
-            if state:
-                self._tx_fault_mask |= mask
-                self._tx_power_mw[channel] = 0.0
-            else:
-                self._tx_fault_mask &= ~mask
-                if not self._tx_disable_mask & mask:
-                    self._tx_power_mw[channel] = 0.5
-        elif fault_type == 'rx_los':
-            mask = 1 << channel
-            if state:
-                self._rx_los_mask |= mask
-                self._rx_power_mw[channel] = 0.0
-            else:
-                self._rx_los_mask &= ~mask
-                if not (self._tx_disable_mask & mask or self._tx_fault_mask & mask):
-                    self._rx_power_mw[channel] = 0.4
-        else:
+        handler = self._FAULT_HANDLERS.get(fault_type)
+        if handler is None:
             raise EmulationError(f"Unknown fault type: {fault_type}")
+        handler(self, channel, self._channel_masks[channel], state)
             
         # Update the memory map but prevent random variations
-        self.memory_map.select_page(0x11)
-        base_addr = 0x10 + (channel * 12)
-        self.memory_map.write_word(base_addr + 0, self._encode_power(self._tx_power_mw[channel]))
-        self.memory_map.write_word(base_addr + 2, self._encode_power(self._rx_power_mw[channel]))
-        self.memory_map.write_word(base_addr + 4, self._encode_bias(self._tx_bias_ma[channel]))
+        self._write_channel_triple(channel)
+    
+    def _apply_tx_fault(self, channel: int, mask: int, state: bool) -> None:
+        """Raise or clear a TX fault on one lane"""
+        self._tx_fault_mask = (self._tx_fault_mask & ~mask) | (mask & -bool(state))
+        if state:
+            self._tx_power_mw[channel] = 0.0
+        elif not self._tx_disable_mask & mask:
+            self._tx_power_mw[channel] = 0.5
+    
+    def _apply_rx_los(self, channel: int, mask: int, state: bool) -> None:
+        """Raise or clear an RX loss of signal on one lane"""
+        self._rx_los_mask = (self._rx_los_mask & ~mask) | (mask & -bool(state))
+        if state:
+            self._rx_power_mw[channel] = 0.0
+        elif not (self._tx_disable_mask & mask or self._tx_fault_mask & mask):
+            self._rx_power_mw[channel] = 0.4
+    
+    # simulate_fault dispatch table: fault type -> handler(self, channel, mask, state)
+    _FAULT_HANDLERS = MappingProxyType({
+        'tx_fault': _apply_tx_fault,
+        'rx_los': _apply_rx_los,
+    })
+    
+    def _write_channel_triple(self, channel: int) -> None:
+        """Write one lane's TX power, RX power and TX bias words without variation"""
+        buffer, base = self._mm_get_page(0x11)
+        try:
+            _LANE_MONITORS.pack_into(buffer, base + self._channel_bases[channel],
+                                     self._encode_power(self._tx_power_mw[channel]),
+                                     self._encode_power(self._rx_power_mw[channel]),
+                                     self._encode_bias(self._tx_bias_ma[channel]))
+        except struct.error as e:
+            raise EmulationError(f"Monitoring value out of range for word: {e}") from e
+    
+    def write_register(self, address: int, value: int) -> None:
+        """Write to module's memory map"""
+        super().write_register(address, value)
+        self._invalidate_flags()
+    
+    def write_registers(self, start_address: int, data: bytes) -> None:
+        """Write consecutive bytes to module's memory map"""
+        super().write_registers(start_address, data)
+        self._invalidate_flags()
+    
+    def _invalidate_flags(self) -> None:
+        """Force the next refresh to rewrite the flags byte after a host write to page 0x83"""
+        if self.memory_map.current_page == 0x83:
+            self._last_flags = None
     
     def set_temperature(self, temperature: float) -> None:
-        """Set module temperature"""
+        """Set module temperature; the flags page updates on the next register read"""
         self._temperature = temperature
-        self.update_monitoring()
+        self._request_monitoring_update()
     
     def set_voltage(self, voltage: float) -> None:
-        """Set module voltage"""
+        """Set module voltage; the monitor word updates on the next register read"""
+        self._check_voltage(voltage)
         self._voltage = voltage
-        self.update_monitoring()
+        self._request_monitoring_update()
     
     def get_active_application(self) -> int:
         """Get the currently active application"""
@@ -234,18 +384,4 @@ class CMISEmulatedModule(EmulatedModule):
     
     def _encode_application(self, rate: float) -> int:
         """Encode a bit rate as a CMIS application code"""
-        # This is a simplified encoding - real modules use standardized application codes
-        if rate == 10.0:
-            return 0x1
-        elif rate == 25.0:
-            return 0x2
-        elif rate == 40.0:
-            return 0x3
-        elif rate == 100.0:
-            return 0x4
-        elif rate == 200.0:
-            return 0x5
-        elif rate == 400.0:
-            return 0x6
-        else:
-            return 0x0
\ No newline at end of file
+        return _APP_CODE_MAP.get(rate, 0x0)
\ No newline at end of file
@@ -3,12 +3,34 @@ Pre-defined configurations for various types of pluggable modules.
 These configurations can be used to create emulated modules with
 realistic characteristics.
 """
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Mapping
 from .base import ModuleConfig, FormFactor, ModuleType, MediaType
 
+class _LazyConfigs(Mapping[str, ModuleConfig]):
+    """
+    Read-only mapping of configuration names to ModuleConfig objects.
+    Each configuration is built from its keyword arguments on first access
+    and reused afterwards, so importing this module constructs nothing.
+    """
+    def __init__(self, specs: Dict[str, Dict[str, Any]]):
+        self._specs = specs
+        self._configs: Dict[str, ModuleConfig] = {}
+    
+    def __getitem__(self, name: str) -> ModuleConfig:
+        config = self._configs.get(name)
+        if config is None:
+            config = self._configs[name] = ModuleConfig(**self._specs[name])
+        return config
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+    
+    def __len__(self) -> int:
+        return len(self._specs)
+
 # Direct Attach Copper (DAC) Configurations
-DAC_CONFIGS: Dict[str, ModuleConfig] = {
-    'SFP_DAC_1M': ModuleConfig(
+DAC_CONFIGS: Mapping[str, ModuleConfig] = _LazyConfigs({
+    'SFP_DAC_1M': dict(
         form_factor=FormFactor.SFP,
         module_type=ModuleType.SFF,
         media_type=MediaType.COPPER_PASSIVE,
@@ -25,7 +47,7 @@ DAC_CONFIGS: Dict[str, ModuleConfig] = {
         length_meters=1.0
     ),
     
-    'QSFP_DAC_3M': ModuleConfig(
+    'QSFP_DAC_3M': dict(
         form_factor=FormFactor.QSFP,
         module_type=ModuleType.SFF,
         media_type=MediaType.COPPER_PASSIVE,
@@ -42,7 +64,7 @@ DAC_CONFIGS: Dict[str, ModuleConfig] = {
         length_meters=3.0
     ),
     
-    'OSFP_DAC_2M': ModuleConfig(
+    'OSFP_DAC_2M': dict(
         form_factor=FormFactor.OSFP,
         module_type=ModuleType.CMIS,
         media_type=MediaType.COPPER_PASSIVE,
@@ -58,11 +80,11 @@ DAC_CONFIGS: Dict[str, ModuleConfig] = {
         max_power_draw=2.0,
         length_meters=2.0
     )
-}
+})
 
 # Optical Module Configurations
-OPTICAL_CONFIGS: Dict[str, ModuleConfig] = {
-    'SFP_SR': ModuleConfig(
+OPTICAL_CONFIGS: Mapping[str, ModuleConfig] = _LazyConfigs({
+    'SFP_SR': dict(
         form_factor=FormFactor.SFP,
         module_type=ModuleType.SFF,
         media_type=MediaType.MMF,
@@ -79,7 +101,7 @@ OPTICAL_CONFIGS: Dict[str, ModuleConfig] = {
         wavelength_nm=850.0
     ),
     
-    'SFP_LR': ModuleConfig(
+    'SFP_LR': dict(
         form_factor=FormFactor.SFP,
         module_type=ModuleType.SFF,
         media_type=MediaType.SMF,
@@ -96,7 +118,7 @@ OPTICAL_CONFIGS: Dict[str, ModuleConfig] = {
         wavelength_nm=1310.0
     ),
     
-    'QSFP_SR4': ModuleConfig(
+    'QSFP_SR4': dict(
         form_factor=FormFactor.QSFP,
         module_type=ModuleType.SFF,
         media_type=MediaType.MMF,
@@ -113,7 +135,7 @@ OPTICAL_CONFIGS: Dict[str, ModuleConfig] = {
         wavelength_nm=850.0
     ),
     
-    'QSFP_DR4': ModuleConfig(
+    'QSFP_DR4': dict(
         form_factor=FormFactor.QSFP,
         module_type=ModuleType.CMIS,
         media_type=MediaType.SMF,
@@ -130,7 +152,7 @@ OPTICAL_CONFIGS: Dict[str, ModuleConfig] = {
         wavelength_nm=1310.0
     ),
     
-    'QSFP_FR4': ModuleConfig(
+    'QSFP_FR4': dict(
         form_factor=FormFactor.QSFP,
         module_type=ModuleType.CMIS,
         media_type=MediaType.SMF,
@@ -147,7 +169,7 @@ OPTICAL_CONFIGS: Dict[str, ModuleConfig] = {
         wavelength_nm=1310.0
     ),
     
-    'OSFP_LR4': ModuleConfig(
+    'OSFP_LR4': dict(
         form_factor=FormFactor.OSFP,
         module_type=ModuleType.CMIS,
         media_type=MediaType.SMF,
@@ -163,4 +185,4 @@ OPTICAL_CONFIGS: Dict[str, ModuleConfig] = {
         max_power_draw=4.5,
         wavelength_nm=1310.0
     )
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -41,9 +41,12 @@ hardware.reset_module()
 hardware.set_low_power_mode(True)
 @endcode
 """
-from typing import Dict, Optional, List, Union
+from typing import Optional, List, Tuple, Union
 from .base import EmulatedModule, EmulationError
 
+## Number of bus addresses covered by the device table (8-bit address byte)
+_I2C_ADDRESS_SPACE = 256
+
 class EmulatedI2CBus:
     """!
     Emulates an I2C bus for module communication.
@@ -87,9 +90,12 @@ class EmulatedI2CBus:
     @endcode
     """
     
+    __slots__ = ('_devices', '_current_address', '_page_registers')
+    
     def __init__(self):
         """Initialize I2C bus"""
-        self._devices: Dict[int, EmulatedModule] = {}
+        # Device table indexed directly by bus address
+        self._devices: List[Optional[EmulatedModule]] = [None] * _I2C_ADDRESS_SPACE
         self._current_address = 0
         self._page_registers = {
             0xA0: 0x7F,  # SFF page register
@@ -100,47 +106,60 @@ class EmulatedI2CBus:
     
     def attach_device(self, address: int, device: EmulatedModule) -> None:
         """Attach a device to the I2C bus at specified address"""
-        if address in self._devices:
+        if not 0 <= address < _I2C_ADDRESS_SPACE:
+            raise EmulationError(f"Invalid I2C address {address:02x}")
+        if self._devices[address] is not None:
             raise EmulationError(f"Address {address:02x} already in use")
         self._devices[address] = device
     
     def detach_device(self, address: int) -> None:
         """Detach a device from the I2C bus"""
-        if address in self._devices:
-            del self._devices[address]
+        if 0 <= address < _I2C_ADDRESS_SPACE:
+            self._devices[address] = None
     
     def write_byte(self, address: int, reg_address: int, value: int) -> None:
         """Write a byte to a device register"""
-        if address not in self._devices:
+        device = self._devices[address] if 0 <= address < _I2C_ADDRESS_SPACE else None
+        if device is None:
             raise EmulationError(f"No device at address {address:02x}")
         
-        device = self._devices[address]
-        
         # Handle page selection if this is a page register
-        if address in self._page_registers and reg_address == self._page_registers[address]:
+        page_register = self._page_registers.get(address)
+        if page_register is not None and reg_address == page_register:
             # Convert address to page number for SFF modules
             if address in [0xA0, 0xA2]:
                 device.memory_map.select_page(address)
             else:
                 device.memory_map.select_page(value)
         else:
-            device.memory_map.write_byte(reg_address, value)
+            device.write_register(reg_address, value)
     
     def read_byte(self, address: int, reg_address: int) -> int:
         """Read a byte from a device register"""
-        if address not in self._devices:
+        device = self._devices[address] if 0 <= address < _I2C_ADDRESS_SPACE else None
+        if device is None:
             raise EmulationError(f"No device at address {address:02x}")
         
-        device = self._devices[address]
+        # Apply any monitoring refresh deferred by the module's setters
+        device._maybe_refresh()
         return device.memory_map.read_byte(reg_address)
     
+    def read_bytes(self, address: int, reg_address: int, count: int) -> bytes:
+        """Read multiple bytes from consecutive registers"""
+        device = self._devices[address] if 0 <= address < _I2C_ADDRESS_SPACE else None
+        if device is None:
+            raise EmulationError(f"No device at address {address:02x}")
+        
+        device._maybe_refresh()
+        return device.memory_map.read_bytes(reg_address, count)
+    
     def write_bytes(self, address: int, reg_address: int, data: bytes) -> None:
         """Write multiple bytes to consecutive registers"""
-        if address not in self._devices:
+        device = self._devices[address] if 0 <= address < _I2C_ADDRESS_SPACE else None
+        if device is None:
             raise EmulationError(f"No device at address {address:02x}")
         
-        device = self._devices[address]
-        device.memory_map.write_bytes(reg_address, data)
+        device.write_registers(reg_address, data)
 
 class EmulatedGPIO:
     """!
@@ -187,15 +206,20 @@ class EmulatedGPIO:
           while output pins (mod_select, reset, lpmode) control the module.
     """
     
+    # Pin states are slot attributes named after the pins
+    __slots__ = ('mod_present', 'mod_select', 'reset', 'lpmode', 'interrupt', '_device')
+    ## Names accepted by set_pin()/get_pin()
+    _VALID_PINS = frozenset(__slots__[:-1])
+    ## Pins driven by the module rather than the host
+    _INPUT_PINS = frozenset({'mod_present', 'interrupt'})
+    
     def __init__(self):
         """Initialize GPIO controller"""
-        self._pins: Dict[str, bool] = {
-            'mod_present': False,
-            'mod_select': False,
-            'reset': False,
-            'lpmode': False,
-            'interrupt': False
-        }
+        self.mod_present = False
+        self.mod_select = False
+        self.reset = False
+        self.lpmode = False
+        self.interrupt = False
         self._device: Optional[EmulatedModule] = None
     
     def attach_device(self, device: EmulatedModule) -> None:
@@ -205,27 +229,27 @@ class EmulatedGPIO:
     def detach_device(self) -> None:
         """Detach the module from the GPIO controller"""
         self._device = None
-        self._pins['mod_present'] = False
+        self.mod_present = False
     
     def set_pin(self, pin_name: str, state: bool) -> None:
         """Set GPIO pin state"""
-        if pin_name not in self._pins:
+        if pin_name not in self._VALID_PINS:
             raise EmulationError(f"Unknown GPIO pin: {pin_name}")
         
-        self._pins[pin_name] = state
+        setattr(self, pin_name, state)
         
         if self._device:
             self._device.set_gpio_state(pin_name, state)
     
     def get_pin(self, pin_name: str) -> bool:
         """Get GPIO pin state"""
-        if pin_name not in self._pins:
+        if pin_name not in self._VALID_PINS:
             raise EmulationError(f"Unknown GPIO pin: {pin_name}")
         
-        if self._device and pin_name in ['mod_present', 'interrupt']:
+        if self._device and pin_name in self._INPUT_PINS:
             return self._device.get_gpio_state(pin_name)
         
-        return self._pins[pin_name]
+        return getattr(self, pin_name)
 
 class EmulatedHardwareInterface:
     """!
@@ -295,12 +319,15 @@ class EmulatedHardwareInterface:
         self.i2c = EmulatedI2CBus()
         self.gpio = EmulatedGPIO()
         self._module: Optional[EmulatedModule] = None
+        self._attached_addresses: Tuple[int, ...] = ()
     
     def attach_module(self, module: EmulatedModule) -> None:
         """
         Attach a module to the interface.
-        Sets up I2C and GPIO connections.
+        Sets up I2C and GPIO connections, replacing any module already attached.
         """
+        # Release the previous module's bus addresses before taking new ones
+        self.detach_module()
         self._module = module
         
         # Attach to GPIO
@@ -309,11 +336,16 @@ class EmulatedHardwareInterface:
         
         # Attach to I2C based on module type
         if module.config.module_type.name == 'CMIS':
-            self.i2c.attach_device(0x50, module)  # Lower pages
-            self.i2c.attach_device(0x51, module)  # Upper pages
+            self._attached_addresses = (0x50, 0x51)  # Lower/upper pages
         else:  # SFF
-            self.i2c.attach_device(0xA0, module)  # ID/Status pages
-            self.i2c.attach_device(0xA2, module)  # Diagnostic pages
+            self._attached_addresses = (0xA0, 0xA2)  # ID/Status and diagnostic pages
+        for address in self._attached_addresses:
+            self.i2c.attach_device(address, module)
+        
+        # While attached, register access goes straight to the bus, which
+        # reports unknown addresses itself
+        self.read_register = self.i2c.read_byte
+        self.write_register = self.i2c.write_byte
     
     def detach_module(self) -> None:
         """
@@ -327,12 +359,12 @@ class EmulatedHardwareInterface:
         self.gpio.detach_device()
         
         # Detach from I2C
-        for address in [0x50, 0x51, 0xA0, 0xA2]:
-            try:
-                self.i2c.detach_device(address)
-            except EmulationError:
-                pass
+        for address in self._attached_addresses:
+            self.i2c.detach_device(address)
+        self._attached_addresses = ()
         
+        # Fall back to the checked class methods
+        del self.read_register, self.write_register
         self._module = None
     
     def reset_module(self) -> None:
@@ -367,7 +399,7 @@ class EmulatedHardwareInterface:
         if not self._module:
             raise EmulationError("No module attached")
         
-        return [self.i2c.read_byte(bus_address, reg_address + i) for i in range(count)]
+        return list(self.i2c.read_bytes(bus_address, reg_address, count))
     
     def write_registers(self, bus_address: int, reg_address: int, values: Union[bytes, List[int]]) -> None:
         """Write to multiple consecutive registers"""
@@ -53,10 +53,12 @@ module.simulate_fault('tx_fault', True)
 @see EmulatedModule
 @see ModuleConfig
 """
-import random
 import struct
 from typing import Dict, List, Optional
-from .base import EmulatedModule, ModuleConfig, EmulationError
+from .base import EmulatedModule, ModuleConfig, EmulationError, TEMP_VOLTAGE_LAYOUT, WORD_LAYOUT
+
+## A2h diagnostic block at bytes 96-105: temperature, voltage, TX bias, TX power, RX power
+_DIAG_BLOCK = struct.Struct('>5H')
 
 class SFFEmulatedModule(EmulatedModule):
     """!
@@ -82,6 +84,9 @@ class SFFEmulatedModule(EmulatedModule):
     according to the standards.
     """
     
+    ## Largest voltage offset (V) added by update_monitoring()
+    _VOLTAGE_VARIATION = 0.01
+    
     def __init__(self, config: ModuleConfig):
         """Initialize SFF module emulator"""
         super().__init__(config)
@@ -106,33 +111,20 @@ class SFFEmulatedModule(EmulatedModule):
         
         @note This is called automatically by the constructor and during reset.
         """
-        # Initialize pages
-        self.add_memory_pages([0x00, 0x01, 0xA0, 0xA2])  # Add standard and diagnostic pages
-        
-        # Clear all memory pages first
-        for page in [0x00, 0x01, 0xA0, 0xA2]:
-            self.memory_map.select_page(page)
-            for addr in range(256):
-                self.memory_map.write_byte(addr, 0x00)
+        # Add and clear the identification and diagnostic pages
+        for page in [0xA0, 0xA2]:
+            self.memory_map.load_page(page, b'')
+        
+        # Pages 0x00/0x01 are never written by the SFF map, so they are only
+        # allocated if a host selects them; on reset any such page is cleared
+        for page in [0x00, 0x01]:
+            if self.memory_map.is_allocated(page):
+                self.memory_map.load_page(page, b'')
+            else:
+                self.memory_map.add_page(page, lazy=True)
         
         # Select A0 page for writing basic information
         self.memory_map.select_page(0xA0)
-        # Basic module information
-        self.memory_map.write_byte(0x00, self.config.identifier)  # Identifier
-        self._write_string(0x14, self.config.vendor_name, 16)
-        self._write_string(0x28, self.config.part_number, 16)
-        self._write_string(0x38, self.config.revision, 4)
-        self._write_string(0x44, self.config.serial_number, 16)
-        
-        # Switch to A2 page for diagnostics setup
-        self.memory_map.select_page(0xA2)
-        
-        # Enable digital diagnostics
-        self.memory_map.write_byte(0x5C, 0x40)  # Digital diagnostics implemented
-        
-        # Initial monitoring values
-        self.update_monitoring()
-        
         # Basic module information
         self.memory_map.write_byte(0x00, self.config.identifier)  # Identifier
         self.memory_map.write_byte(0x01, 0x00)  # Status
@@ -188,58 +180,95 @@ class SFFEmulatedModule(EmulatedModule):
         - Alarm flags (byte 112)
         
         @note The current page selection is preserved across the update.
+        @note Outside a batch() the SFF setters write the memory map
+              immediately; inside one, the refresh waits for the batch to
+              exit, so direct memory_map readers see it only afterwards.
+        @note The copper or optical variant is picked from
+              _MONITORING_UPDATES by indexing with _is_copper, so no
+              media-type branch runs per update.
         """
+        self._MONITORING_UPDATES[self._is_copper](self)
+    
+    def _update_monitoring_optical(self) -> None:
+        """Refresh all five diagnostic words, then the status and alarm bytes"""
         # Add some random variation to values (reduced for stability)
-        temp_variation = random.uniform(-0.05, 0.05)
-        voltage_variation = random.uniform(-0.01, 0.01)
-        
-        # Get current page
-        current_page = self.memory_map.current_page
-        
-        # Select A2h page for diagnostics
-        self.memory_map.select_page(0xA2)
-        
-        # Temperature and voltage (mandatory)
+        rand = self._rng.random
+        temp_variation = (rand() - 0.5) * 0.1        # ±0.05°C
+        voltage_variation = (rand() - 0.5) * 0.02    # ±0.01V
+        bias_variation = (rand() - 0.5) * 0.4        # ±0.2mA
+        power_variation = (rand() - 0.5) * 0.02      # ±0.01mW
+        
+        # Write the A2h diagnostics page in place, leaving the page selection alone
+        buffer, base = self._mm_get_page(0xA2)
         temp = self._temperature + temp_variation
-        self.memory_map.write_word(0x60, self._encode_temperature(temp))
-        self.memory_map.write_word(0x62, self._encode_voltage(self._voltage + voltage_variation))
-        
-        # Optional monitoring values for optical modules
-        if not self.config.media_type.name.startswith('COPPER'):
-            bias_variation = random.uniform(-0.2, 0.2)
-            power_variation = random.uniform(-0.01, 0.01)
-            
-            self.memory_map.write_word(0x64, self._encode_bias(self._tx_bias_ma + bias_variation))
-            self.memory_map.write_word(0x66, self._encode_power(self._tx_power_mw + power_variation))
-            self.memory_map.write_word(0x68, self._encode_power(self._rx_power_mw + power_variation))
-        
-        # Update status and alarm flags
-        status = 0x00
-        alarms = 0x00
+        try:
+            _DIAG_BLOCK.pack_into(buffer, base + 0x60,
+                                  self._encode_temperature(temp),
+                                  self._encode_voltage(self._voltage + voltage_variation),
+                                  self._encode_bias(self._tx_bias_ma + bias_variation),
+                                  self._encode_power(self._tx_power_mw + power_variation),
+                                  self._encode_power(self._rx_power_mw + power_variation))
+        except struct.error as e:
+            raise EmulationError(f"Diagnostic value out of range for word: {e}") from e
+        self._write_status_alarms(buffer, base, temp)
+    
+    def _update_monitoring_copper(self) -> None:
+        """Refresh temperature and voltage only; bias/power (0x64-0x69) stay zero"""
+        rand = self._rng.random
+        temp_variation = (rand() - 0.5) * 0.1        # ±0.05°C
+        voltage_variation = (rand() - 0.5) * 0.02    # ±0.01V
         
-        # Status bits
-        if self._tx_disable:
-            status |= 0x40
-        if self._tx_fault:
-            status |= 0x20
-        if self._rx_los:
-            status |= 0x10
-            
-        # Alarm bits
-        if temp > 75.0:  # High temp alarm
-            alarms |= 0x80
-        if temp < -5.0:  # Low temp alarm
-            alarms |= 0x40
-        if self._voltage > 3.6:  # High voltage alarm
-            alarms |= 0x20
-        if self._voltage < 3.0:  # Low voltage alarm
-            alarms |= 0x10
+        buffer, base = self._mm_get_page(0xA2)
+        temp = self._temperature + temp_variation
+        try:
+            TEMP_VOLTAGE_LAYOUT.pack_into(buffer, base + 0x60,
+                                          self._encode_temperature(temp),
+                                          self._encode_voltage(self._voltage + voltage_variation))
+        except struct.error as e:
+            raise EmulationError(f"Diagnostic value out of range for word: {e}") from e
+        self._write_status_alarms(buffer, base, temp)
+    
+    ## update_monitoring() variants indexed by _is_copper: optical, then copper
+    _MONITORING_UPDATES = (_update_monitoring_optical, _update_monitoring_copper)
+    
+    def _write_status_alarms(self, buffer: bytearray, base: int, temp: float) -> None:
+        """Write the status (110) and alarm (112) bytes of the A2h page"""
+        # Each condition is shifted into its bit position rather than tested
+        # with a branch
+        buffer[base + 0x6E] = (bool(self._tx_disable) << 6    # TX disable
+                               | bool(self._tx_fault) << 5    # TX fault
+                               | bool(self._rx_los) << 4)     # RX LOS
+        buffer[base + 0x70] = self._alarm_flags(temp)
+    
+    def _update_status(self, set_mask: int, clear_mask: int) -> None:
+        """Apply set/clear masks to the A2h status byte (110) in one read-modify-write"""
+        buffer, base = self._mm_get_page(0xA2)
+        address = base + 0x6E
+        buffer[address] = (buffer[address] & ~clear_mask) | set_mask
+    
+    def _alarm_flags(self, temp: float) -> int:
+        """Compute the alarm byte (112) for a temperature and the current voltage"""
+        return ((temp > 75.0) << 7                   # High temp alarm
+                | (temp < -5.0) << 6                 # Low temp alarm
+                | (self._voltage > 3.6) << 5         # High voltage alarm
+                | (self._voltage < 3.0) << 4)        # Low voltage alarm
+    
+    def _refresh_temp_voltage(self, address: int, value: int) -> None:
+        """!
+        Fast path for a temperature or voltage change.
         
-        self.memory_map.write_byte(0x6E, status)
-        self.memory_map.write_byte(0x70, alarms)
+        @param address A2h address of the changed monitor word (96 or 98)
+        @param value Encoded word to write; the caller has checked that it fits
         
-        # Restore original page
-        self.memory_map.select_page(current_page)
+        Writes only the changed word and the alarm byte (112) instead of a full
+        update_monitoring(); inside a batch() the full refresh is deferred as usual.
+        """
+        if self._batch_depth:
+            self._request_monitoring_update()
+            return
+        buffer, base = self._mm_get_page(0xA2)
+        WORD_LAYOUT.pack_into(buffer, base + address, value)
+        buffer[base + 0x70] = self._alarm_flags(self._temperature)
     
     def set_tx_disable(self, disable: bool) -> None:
         """!
@@ -274,32 +303,18 @@ class SFFEmulatedModule(EmulatedModule):
         
         @note The current page selection is preserved.
         """
-        # Save current page
-        current_page = self.memory_map.current_page
-
         self._tx_disable = disable
+        # Copper modules have no TX power monitor, so bytes 102-103 stay zero
+        if not self._is_copper:
+            # Zero power is written exactly, skipping random variation
+            self._tx_power_mw = 0.0 if disable else 0.5  # Typical power when enabled
+            self.memory_map.write_word_page(0xA2, 0x66, self._encode_power(self._tx_power_mw))
         if disable:
-            self._tx_power_mw = 0.0
-            # Force update with exactly zero power and skip random variation
-            self.memory_map.select_page(0xA2)
-            self.memory_map.write_word(0x66, 0)
             # Set TX disable bit
-            status = self.memory_map.read_byte(0x6E)
-            status |= 0x40
-            self.memory_map.write_byte(0x6E, status)
+            self._update_status(0x40, 0)
         else:
-            self._tx_power_mw = 0.5  # Return to typical power
-            # Update TX power value
-            self.memory_map.select_page(0xA2)
-            power_value = self._encode_power(self._tx_power_mw)
-            self.memory_map.write_word(0x66, power_value)
             # Clear TX disable bit
-            status = self.memory_map.read_byte(0x6E)
-            status &= ~0x40
-            self.memory_map.write_byte(0x6E, status)
-        
-        # Restore original page
-        self.memory_map.select_page(current_page)
+            self._update_status(0, 0x40)
     
     def simulate_fault(self, fault_type: str, state: bool) -> None:
         """!
@@ -336,57 +351,41 @@ class SFFEmulatedModule(EmulatedModule):
         assert not (status & 0x20)
         @endcode
         """
-        # Save current page
-        current_page = self.memory_map.current_page
-
+        mm = self.memory_map
         if fault_type == 'tx_fault':
             self._tx_fault = state
             if state:
                 self._tx_power_mw = 0.0
                 # Force update with exactly zero power and skip random variation
-                self.memory_map.select_page(0xA2)
-                self.memory_map.write_word(0x66, 0)
-                # Update status bits
-                status = self.memory_map.read_byte(0x6E)
-                status |= 0x20  # Set TX fault bit
-                self.memory_map.write_byte(0x6E, status)
+                mm.write_word_page(0xA2, 0x66, 0)
+                # Set TX fault bit
+                self._update_status(0x20, 0)
             else:
                 self._tx_power_mw = 0.5
                 # Clear TX fault bit
-                self.memory_map.select_page(0xA2)
-                status = self.memory_map.read_byte(0x6E)
-                status &= ~0x20
-                self.memory_map.write_byte(0x6E, status)
+                self._update_status(0, 0x20)
         elif fault_type == 'rx_los':
             self._rx_los = state
             if state:
                 self._rx_power_mw = 0.0
                 # Force update with exactly zero power and skip random variation
-                self.memory_map.select_page(0xA2)
-                self.memory_map.write_word(0x68, 0)
-                # Update status bits
-                status = self.memory_map.read_byte(0x6E)
-                status |= 0x10  # Set RX LOS bit
-                self.memory_map.write_byte(0x6E, status)
+                mm.write_word_page(0xA2, 0x68, 0)
+                # Set RX LOS bit
+                self._update_status(0x10, 0)
             else:
                 self._rx_power_mw = 0.4
                 # Clear RX LOS bit
-                self.memory_map.select_page(0xA2)
-                status = self.memory_map.read_byte(0x6E)
-                status &= ~0x10
-                self.memory_map.write_byte(0x6E, status)
+                self._update_status(0, 0x10)
         else:
             raise EmulationError(f"Unknown fault type: {fault_type}")
-        
-        # Restore original page
-        self.memory_map.select_page(current_page)
     
     def set_temperature(self, temperature: float) -> None:
-        """Set module temperature"""
+        """Set module temperature; written at once unless a batch() is open"""
         self._temperature = temperature
-        self.update_monitoring()
+        self._refresh_temp_voltage(0x60, self._encode_temperature(temperature))
     
     def set_voltage(self, voltage: float) -> None:
-        """Set module voltage"""
+        """Set module voltage; written at once unless a batch() is open"""
+        value = self._check_voltage(voltage)
         self._voltage = voltage
-        self.update_monitoring()
\ No newline at end of file
+        self._refresh_temp_voltage(0x62, value)
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Tests for concurrent status polling with poll_all().
+"""
+import asyncio
+import struct
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from src import CMISModule, HardwareInterface, SFFModule, poll_all
+
+class FakeBus(HardwareInterface):
+    """Hardware interface that records the timing of every bus transaction"""
+
+    def __init__(self, temperature: float, delay: float = 0.05, step: float = 0.0):
+        super().__init__()
+        self.temperature = temperature
+        self.step = step
+        self.delay = delay
+        self.transactions: List[Tuple[float, float]] = []
+        self.max_active = 0
+        self._active = 0
+        self._count_lock = threading.Lock()
+
+    def _transaction(self) -> None:
+        """Simulate one slow bus transaction, tracking how many run at once"""
+        with self._count_lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        start = time.perf_counter()
+        time.sleep(self.delay)
+        with self._count_lock:
+            self._active -= 1
+            self.transactions.append((start, time.perf_counter()))
+
+    def read_register(self, address: int) -> int:
+        self._transaction()
+        return 0
+
+    def read_register_block(self, address: int, length: int,
+                            into: Optional[bytearray] = None) -> bytearray:
+        buffer = into if into is not None else bytearray(length)
+        self._transaction()
+        struct.pack_into('>2H', buffer, 0, int(self.temperature * 256), 33000)
+        self.temperature += self.step
+        return buffer
+
+def test_poll_all_preserves_order():
+    """Test that statuses come back in module order, not completion order"""
+    slow = SFFModule(FakeBus(40.0, delay=0.1))
+    fast = SFFModule(FakeBus(25.0, delay=0.01))
+    statuses = asyncio.run(poll_all([slow, fast]))
+    assert [round(status.temperature) for status in statuses] == [40, 25]
+
+def test_poll_all_overlaps_buses():
+    """Test that reads on separate buses run concurrently"""
+    bus_a, bus_b = FakeBus(30.0), FakeBus(31.0)
+    asyncio.run(poll_all([SFFModule(bus_a), SFFModule(bus_b)]))
+    (start_a, end_a), = bus_a.transactions
+    (start_b, end_b), = bus_b.transactions
+    assert start_a < end_b and start_b < end_a
+
+def test_poll_all_serializes_one_bus():
+    """Test that modules sharing a bus never access it concurrently"""
+    bus = FakeBus(30.0, delay=0.01)
+    # CMISModule uses the default thread-backed get_status_async path
+    modules = [SFFModule(bus), CMISModule(bus), SFFModule(bus), CMISModule(bus)]
+    statuses = asyncio.run(poll_all(modules))
+    assert len(statuses) == len(modules)
+    assert bus.max_active == 1
+
+def test_poll_all_repeated_event_loops():
+    """Test that one bus can be polled from successive event loops"""
+    bus = FakeBus(30.0, delay=0.01)
+    modules = [SFFModule(bus), SFFModule(bus)]
+    for _ in range(3):
+        statuses = asyncio.run(poll_all(modules))
+        assert [round(status.temperature) for status in statuses] == [30, 30]
+
+def test_poll_all_same_module_twice():
+    """Test that concurrent polls of one module each decode their own read"""
+    module = SFFModule(FakeBus(30.0, delay=0.0, step=1.0))
+    statuses = asyncio.run(poll_all([module] * 20))
+    assert sorted(round(status.temperature) for status in statuses) == list(range(30, 50))
@@ -31,10 +31,29 @@ def test_invalid_memory_access(sff_module: EmulatedModule):
     with pytest.raises(EmulationError):
         sff_module.memory_map.read_byte(0x1000)  # Invalid address - beyond page size
 
+def test_invalid_voltage(sff_module: EmulatedModule):
+    """Test that out-of-range voltages are rejected by the setter"""
+    # 0.0 V itself fits a word, but the next refresh could vary it below zero
+    for voltage in (7.0, -1.0, 0.0):
+        with pytest.raises(EmulationError):
+            sff_module.set_voltage(voltage)
+
 def test_memory_page_switching(sff_module: EmulatedModule):
     """Test memory page switching functionality"""
     sff_module.memory_map.select_page(0x01)
     assert sff_module.memory_map.current_page == 0x01
     
     with pytest.raises(EmulationError):
-        sff_module.memory_map.select_page(0xFF)  # Invalid page
\ No newline at end of file
+        sff_module.memory_map.select_page(0xFF)  # Invalid page
+
+def test_batched_monitoring_updates(sff_module: EmulatedModule, temp_value: float, voltage_value: float):
+    """Test that setters inside a batch defer the monitoring refresh to batch exit"""
+    with sff_module.batch():
+        sff_module.set_temperature(temp_value)
+        sff_module.set_voltage(voltage_value)
+        assert sff_module._monitoring_dirty
+    assert not sff_module._monitoring_dirty
+    
+    sff_module.memory_map.select_page(0xA2)
+    assert abs(sff_module.memory_map.read_word(0x60) / 256.0 - temp_value) < 0.1
+    assert abs(sff_module.memory_map.read_word(0x62) / 10000.0 - voltage_value) < 0.01
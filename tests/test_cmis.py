@@ -1,9 +1,11 @@
 """
 Tests specific to CMIS module functionality.
 """
+import dataclasses
 import pytest
 from tests.emulation.cmis import CMISEmulatedModule
 from tests.emulation.base import EmulationError
+from tests.emulation.configs import MediaType, ModuleConfig
 
 def test_cmis_application_selection(cmis_module: CMISEmulatedModule):
     """Test application selection functionality"""
@@ -68,4 +70,44 @@ def test_cmis_temperature_alarms(cmis_module: CMISEmulatedModule):
     # Check alarm flags
     cmis_module.memory_map.select_page(0x83)
     flags = cmis_module.memory_map.read_byte(0x00)
-    assert flags & 0x80  # High temp alarm should be set
\ No newline at end of file
+    assert flags & 0x80  # High temp alarm should be set
+
+def test_cmis_flags_restored_after_host_write(cmis_module: CMISEmulatedModule):
+    """Test that a host write to the flags page is overwritten by the next refresh"""
+    cmis_module.memory_map.select_page(0x83)
+    cmis_module.write_register(0x00, 0xFF)
+    cmis_module.update_monitoring()
+    assert cmis_module.memory_map.read_byte(0x00) == 0x00  # No alarms at 25°C/3.3V
+    
+    # A reset must rewrite the flags even if the cached value still matches
+    cmis_module.set_temperature(75.0)
+    cmis_module.update_monitoring()
+    cmis_module.memory_map.write_byte(0x00, 0x00)  # Bypasses the host-write hook
+    cmis_module.set_gpio_state('reset', True)
+    cmis_module.memory_map.select_page(0x83)
+    assert cmis_module.memory_map.read_byte(0x00) & 0x80
+
+@pytest.mark.parametrize("num_channels", [1, 4])
+@pytest.mark.parametrize("media_type", [MediaType.MMF, MediaType.COPPER_PASSIVE])
+def test_cmis_generated_update_matches_generic(module_config: ModuleConfig, media_type: MediaType,
+                                               num_channels: int):
+    """Test that the generated monitoring update writes exactly what the generic method does"""
+    config = dataclasses.replace(module_config, media_type=media_type, num_channels=num_channels)
+    generated, generic = CMISEmulatedModule(config), CMISEmulatedModule(config)
+    
+    # Start both from the same state and noise sequence
+    for module, update in ((generated, CMISEmulatedModule.update_monitoring),
+                           (generic, CMISEmulatedModule._update_monitoring_generic)):
+        module.initialize_channels()
+        module._last_flags = None
+        module._rng.seed(1234)
+        module.set_tx_disable(0, True)
+        module.set_temperature(75.0)
+        for _ in range(5):
+            update(module)
+    
+    for page in (0x00, 0x11, 0x83):
+        generated_buffer, generated_base = generated.memory_map.get_page(page)
+        generic_buffer, generic_base = generic.memory_map.get_page(page)
+        assert (generated_buffer[generated_base:generated_base + 256]
+                == generic_buffer[generic_base:generic_base + 256]), f"page {page:#x}"
\ No newline at end of file
@@ -1,16 +1,14 @@
 """
 Tests for the emulated hardware interface.
 """
+import dataclasses
 import pytest
 from typing import Generator
 from .emulation.base import EmulatedModule
+from .emulation.cmis import CMISEmulatedModule
+from .emulation.configs import ModuleConfig, ModuleType
 from .emulation.hardware import EmulatedHardwareInterface, EmulationError
 
-@pytest.fixture
-def hardware() -> EmulatedHardwareInterface:
-    """Provide an emulated hardware interface"""
-    return EmulatedHardwareInterface()
-
 def test_module_attachment(hardware: EmulatedHardwareInterface, sff_module: EmulatedModule):
     """Test module attachment and detection"""
     assert not hardware.get_module_present()
@@ -21,6 +19,17 @@ def test_module_attachment(hardware: EmulatedHardwareInterface, sff_module: Emul
     hardware.detach_module()
     assert not hardware.get_module_present()
 
+def test_module_replacement(hardware: EmulatedHardwareInterface, sff_module: EmulatedModule,
+                            module_config: ModuleConfig):
+    """Test that attaching a new module releases the previous module's addresses"""
+    hardware.attach_module(sff_module)
+    hardware.attach_module(CMISEmulatedModule(dataclasses.replace(module_config, module_type=ModuleType.CMIS)))
+    
+    hardware.detach_module()
+    for address in (0xA0, 0xA2, 0x50, 0x51):
+        with pytest.raises(EmulationError):
+            hardware.i2c.read_byte(address, 0x00)
+
 def test_i2c_access(hardware: EmulatedHardwareInterface, sff_module: EmulatedModule):
     """Test I2C register access"""
     hardware.attach_module(sff_module)
@@ -106,4 +115,37 @@ def test_error_handling(hardware: EmulatedHardwareInterface, sff_module: Emulate
     # Test detach and access
     hardware.detach_module()
     with pytest.raises(EmulationError):
-        hardware.read_register(0xA0, 0x00)
\ No newline at end of file
+        hardware.read_register(0xA0, 0x00)
+
+def test_deferred_monitoring_refresh(hardware: EmulatedHardwareInterface, sff_module: EmulatedModule):
+    """Test that a pending monitoring refresh runs on the next register read"""
+    hardware.attach_module(sff_module)
+    hardware.write_register(0xA2, 0x7F, 0xA2)  # Select A2h page
+    
+    # Temperature changes are written straight away without a full refresh
+    sff_module.set_temperature(45.0)
+    assert not sff_module._monitoring_dirty
+    temp_raw = (hardware.read_register(0xA2, 96) << 8) | hardware.read_register(0xA2, 97)
+    assert abs(temp_raw / 256.0 - 45.0) < 0.1
+    
+    sff_module._request_monitoring_update()
+    assert sff_module._monitoring_dirty
+    hardware.read_register(0xA2, 96)
+    assert not sff_module._monitoring_dirty
+
+def test_deferred_refresh_through_bus(hardware: EmulatedHardwareInterface, module_config: ModuleConfig):
+    """Test that setter changes and errors surface correctly through register reads"""
+    module = CMISEmulatedModule(dataclasses.replace(module_config, module_type=ModuleType.CMIS))
+    hardware.attach_module(module)
+    hardware.write_register(0x50, 0x7F, 0x83)  # Select the CMIS flags page
+    
+    module.set_temperature(75.0)
+    assert hardware.read_register(0x50, 0x00) & 0x80  # Temperature high alarm
+    module.set_temperature(25.0)
+    assert not hardware.read_register(0x50, 0x00) & 0x80
+    
+    # An out-of-range value is rejected by the setter, not by a later read
+    with pytest.raises(EmulationError):
+        module.set_voltage(7.0)
+    assert module.get_voltage() != 7.0
+    hardware.read_register(0x50, 0x00)
\ No newline at end of file
@@ -1,10 +1,12 @@
 """
 Tests for SFF module-specific features.
 """
+import dataclasses
 import pytest
 import random
 from typing import Generator
 from .emulation.base import EmulatedModule
+from .emulation.configs import MediaType, ModuleConfig
 from .emulation.sff import SFFEmulatedModule
 from .emulation.hardware import EmulatedHardwareInterface, EmulationError
 
@@ -77,6 +79,32 @@ def test_tx_disable_control(hardware: EmulatedHardwareInterface, sff_module: SFF
     tx_power = tx_power_raw * 0.0001  # Convert to mW
     assert tx_power > 0.0
 
+def test_copper_power_stays_zero(hardware: EmulatedHardwareInterface, module_config: ModuleConfig):
+    """Test that TX disable control leaves copper bias/power words (bytes 100-105) at zero"""
+    module = SFFEmulatedModule(dataclasses.replace(module_config, media_type=MediaType.COPPER_PASSIVE))
+    hardware.attach_module(module)
+    hardware.write_register(0xA2, 0x7F, 0xA2)  # Select A2h page
+    
+    for disable in (True, False):
+        module.set_tx_disable(disable)
+        module.update_monitoring()
+        assert hardware.read_registers(0xA2, 100, 6) == [0] * 6
+
+def test_update_monitoring_override(module_config: ModuleConfig):
+    """Test that a subclass override of update_monitoring is used by the module"""
+    class CountingModule(SFFEmulatedModule):
+        calls = 0
+        
+        def update_monitoring(self) -> None:
+            CountingModule.calls += 1
+            super().update_monitoring()
+    
+    module = CountingModule(module_config)
+    assert CountingModule.calls == 1  # Initial refresh during construction
+    with module.batch():
+        module.set_temperature(40.0)
+    assert CountingModule.calls == 2
+
 def test_fault_conditions(hardware: EmulatedHardwareInterface, sff_module: SFFEmulatedModule):
     """Test fault condition handling"""
     hardware.attach_module(sff_module)
@@ -120,21 +148,13 @@ def test_identification(hardware: EmulatedHardwareInterface, sff_module: SFFEmul
     hardware.write_register(0xA0, 0x7F, 0xA0)  # Select A0h page
     
     # Read vendor name
-    vendor_name = ""
-    for i in range(16):
-        char = hardware.read_register(0xA0, 0x14 + i)
-        if char == 0:  # Stop at null termination
-            break
-        vendor_name += chr(char)
+    raw = bytes(hardware.read_registers(0xA0, 0x14, 16))
+    vendor_name = raw.split(b'\x00', 1)[0].decode('ascii')  # Stop at null termination
     assert vendor_name == "Test Vendor"
     
     # Read part number
-    part_number = ""
-    for i in range(16):
-        char = hardware.read_register(0xA0, 0x28 + i)
-        if char == 0:  # Stop at null termination
-            break
-        part_number += chr(char)
+    raw = bytes(hardware.read_registers(0xA0, 0x28, 16))
+    part_number = raw.split(b'\x00', 1)[0].decode('ascii')  # Stop at null termination
     assert part_number == "TEST-PART-001"
 
 def test_random_monitoring(hardware: EmulatedHardwareInterface, sff_module: SFFEmulatedModule):